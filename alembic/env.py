@@ -9,7 +9,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.common.database import Base
 from src.clients.models import Client
-from src.orders.models import Order, OrderItem
+from src.orders.models import Order, OrderItem, IdempotencyKey
 from src.products.models import Product
 from src.auth.models import User
 from src.common.config import settings
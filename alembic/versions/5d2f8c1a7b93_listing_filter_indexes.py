@@ -0,0 +1,50 @@
+"""listing filter indexes
+
+Revision ID: 5d2f8c1a7b93
+Revises: 023fcffc2b10
+Create Date: 2026-10-17 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '5d2f8c1a7b93'
+down_revision: Union[str, None] = '023fcffc2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+indexes = [
+    ('ix_order_id_client_id_order', 'order', ['id_client', 'id_order']),
+    ('ix_order_status_id_order', 'order', ['status', 'id_order']),
+    ('ix_order_created_at', 'order', ['created_at']),
+    ('ix_orderitem_id_order', 'orderitem', ['id_order']),
+    ('ix_orderitem_id_product', 'orderitem', ['id_product']),
+    ('ix_product_category', 'product', ['category']),
+    ('ix_product_price', 'product', ['price']),
+    ('ix_product_stock', 'product', ['stock']),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in indexes:
+            op.create_index(
+                name, table, columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in reversed(indexes):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True
+            )
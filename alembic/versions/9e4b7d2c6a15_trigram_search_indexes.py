@@ -0,0 +1,52 @@
+"""trigram search indexes
+
+Revision ID: 9e4b7d2c6a15
+Revises: 5d2f8c1a7b93
+Create Date: 2026-10-17 11:03:27.914652
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '9e4b7d2c6a15'
+down_revision: Union[str, None] = '5d2f8c1a7b93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+indexes = [
+    ('product', 'name'),
+    ('product', 'description'),
+    ('product', 'category'),
+    ('product', 'bar_code'),
+    ('client', 'name'),
+    ('client', 'email'),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+
+    with op.get_context().autocommit_block():
+        for table, column in indexes:
+            op.create_index(
+                f'ix_{table}_{column}_trgm', table, [column],
+                unique=False,
+                if_not_exists=True,
+                postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in reversed(indexes):
+            op.drop_index(
+                f'ix_{table}_{column}_trgm',
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True
+            )
@@ -0,0 +1,31 @@
+"""version and updated_at columns
+
+Revision ID: e6b2d9a4c1f7
+Revises: c3a7e1f4b2d8
+Create Date: 2026-10-17 16:40:52.318904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'e6b2d9a4c1f7'
+down_revision: Union[str, None] = 'c3a7e1f4b2d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+tables = ['product', 'client', 'order']
+
+
+def upgrade() -> None:
+    for table in tables:
+        op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False))
+
+
+def downgrade() -> None:
+    for table in tables:
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'version')
@@ -0,0 +1,134 @@
+"""Latency under concurrent load: sync Session vs AsyncSession inside async handlers.
+
+Usage:
+    python -m benchmarks.bench_db_latency --url sqlite:///./bench.db --requests 400 --concurrency 50
+
+A slow query (``pg_sleep`` on PostgreSQL, a recursive CTE on SQLite) is served
+by two endpoints: one calling a blocking Session from an ``async def`` handler,
+as the routers did before, and one awaiting an AsyncSession. While the slow
+requests run, the same number of requests hit a DB-free ``/ping`` route; its
+p99 shows how long the event loop was stalled. Requests are driven in-process
+through ``httpx.ASGITransport``.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from src.common.database import get_async_database_url
+
+
+SLOW_QUERIES = {
+    "postgresql": text("SELECT pg_sleep(:depth / 1000000.0)"),
+    "sqlite": text(
+        "WITH RECURSIVE counter(x) AS ("
+        " SELECT 1 UNION ALL SELECT x + 1 FROM counter WHERE x < :depth"
+        ") SELECT count(*) FROM counter"
+    ),
+}
+
+
+def build_app(database_url: str, depth: int, pool_size: int) -> FastAPI:
+    sync_engine = create_engine(database_url, pool_size=pool_size)
+    slow_query = SLOW_QUERIES[sync_engine.dialect.name]
+    SyncSession = sessionmaker(bind=sync_engine)
+
+    async_engine = create_async_engine(get_async_database_url(database_url), pool_size=pool_size)
+    AsyncSession = async_sessionmaker(bind=async_engine)
+
+    def get_sync_db():
+        db = SyncSession()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def get_async_db():
+        async with AsyncSession() as db:
+            yield db
+
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/sync")
+    async def sync_path(db=Depends(get_sync_db)):
+        return {"result": db.execute(slow_query, {"depth": depth}).scalar()}
+
+    @app.get("/async")
+    async def async_path(db=Depends(get_async_db)):
+        result = await db.execute(slow_query, {"depth": depth})
+        return {"result": result.scalar()}
+
+    app.state.engines = (sync_engine, async_engine)
+    return app
+
+
+async def run(app: FastAPI, path: str, total: int, concurrency: int) -> dict:
+    latencies = {path: [], "/ping": []}
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get(path)
+
+        async def one(target: str):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(target)
+                latencies[target].append(time.perf_counter() - start)
+                response.raise_for_status()
+
+        await asyncio.gather(*(one(target) for _ in range(total) for target in (path, "/ping")))
+
+    return latencies
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, latencies: list, elapsed: float):
+    print(
+        f"{label:<12} reqs={len(latencies):<5} rps={len(latencies) / elapsed:8.1f} "
+        f"p50={percentile(latencies, 50) * 1000:7.1f}ms "
+        f"p99={percentile(latencies, 99) * 1000:7.1f}ms "
+        f"mean={statistics.mean(latencies) * 1000:7.1f}ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite:///./bench.db")
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--depth", type=int, default=20000, help="CTE depth on SQLite, microseconds of pg_sleep on PostgreSQL")
+    parser.add_argument("--pool-size", type=int, default=10)
+    args = parser.parse_args()
+
+    app = build_app(args.url, args.depth, args.pool_size)
+
+    for label in ("sync", "async"):
+        start = time.perf_counter()
+        latencies = await run(app, f"/{label}", args.requests, args.concurrency)
+        elapsed = time.perf_counter() - start
+        report(label, latencies[f"/{label}"], elapsed)
+        report(f"{label}/ping", latencies["/ping"], elapsed)
+
+    sync_engine, async_engine = app.state.engines
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,126 @@
+"""Rows/sec per list endpoint with and without ``FAST_JSON_RESPONSES``.
+
+Usage:
+    python -m benchmarks.bench_list_serialization --url sqlite:///./bench.db --rows 1000 --requests 200
+
+The real application is driven in-process through ``httpx.ASGITransport``
+with ``get_db`` pointed at ``--url`` and authentication overridden with an
+admin user. Tables are created and seeded with ``--rows`` products, clients
+and orders (two items each). Every endpoint is then paged with
+``limit=--limit`` for ``--requests`` requests, first through
+``response_model`` validation and then through the column/orjson path. The
+product list cache is cleared before each request so both runs hit the
+database.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from src.auth.security.token import get_current_user
+from src.clients.models import Client
+from src.common.config import settings
+from src.common.database import Base, get_async_database_url, get_db
+from src.main import app
+from src.orders.models import Order, OrderItem
+from src.products.cache import product_cache
+from src.products.models import Product
+
+
+ENDPOINTS = ("/products/", "/products/search?q=Produto", "/clients/", "/orders/", "/orders/?include=")
+
+
+def make_cpf(index: int) -> str:
+    digits = [int(char) for char in f"{index + 100_000_000:09d}"]
+    for size in (10, 11):
+        remainder = sum(digit * weight for digit, weight in zip(digits, range(size, 1, -1))) * 10 % 11
+        digits.append(remainder % 10)
+    return "".join(map(str, digits))
+
+
+def seed(database_url: str, rows: int):
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        db.add_all(
+            Product(
+                name=f"Produto {index}", bar_code=f"BENCH-{index}", description="Produto de benchmark",
+                price=10.0, stock=100, valid_date=datetime(2030, 1, 1), category="bench", section="bench",
+            )
+            for index in range(rows)
+        )
+        db.add_all(
+            Client(name=f"Cliente {index}", cpf=make_cpf(index), email=f"bench{index}@email.com", phone="11999999999")
+            for index in range(rows)
+        )
+        db.flush()
+        db.add_all(
+            Order(
+                id_client=index + 1, total_amount=2, total_price=20.0, status="pendente",
+                created_at=datetime(2024, 1, 1),
+                items=[
+                    OrderItem(id_product=index + 1, amount=1, unit_price=10.0),
+                    OrderItem(id_product=(index + 1) % rows + 1, amount=1, unit_price=10.0),
+                ],
+            )
+            for index in range(rows)
+        )
+        db.commit()
+
+    engine.dispose()
+
+
+async def rows_per_second(client: httpx.AsyncClient, url: str, limit: int, requests: int) -> float:
+    separator = "&" if "?" in url else "?"
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(requests):
+        product_cache.invalidate()
+        response = await client.get(f"{url}{separator}limit={limit}")
+        response.raise_for_status()
+        rows += len(response.json())
+    return rows / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite:///./bench.db")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    seed(args.url, args.rows)
+
+    engine = create_async_engine(get_async_database_url(args.url))
+    SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def bench_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_current_user] = lambda: {"username": "bench", "role": "admin"}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'endpoint':<28} {'model':>10} {'fast':>10} rows/s")
+        for url in ENDPOINTS:
+            settings.FAST_JSON_RESPONSES = False
+            baseline = await rows_per_second(client, url, args.limit, args.requests)
+            settings.FAST_JSON_RESPONSES = True
+            fast = await rows_per_second(client, url, args.limit, args.requests)
+            print(f"{url:<28} {baseline:10.1f} {fast:10.1f} ({fast / baseline:.1f}x)")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,77 @@
+"""Requests/sec on a trivial endpoint: BaseHTTPMiddleware wrapper vs pure ASGI middleware.
+
+Usage:
+    python -m benchmarks.bench_middleware --requests 5000 --concurrency 50
+
+Both apps expose the same ``/ping`` route and stack CORS on top, as
+``src.main`` does. The "before" app uses the ``@app.middleware("http")``
+exception wrapper the project used to register; the "after" app uses
+``SentryExceptionMiddleware``. Sentry is not initialised, so only the
+middleware overhead is measured.
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+
+from src.utils.exceptions import SentryExceptionMiddleware
+
+
+def build_app(pure_asgi: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(CORSMiddleware, allow_origins=["*"])
+
+    if pure_asgi:
+        app.add_middleware(SentryExceptionMiddleware)
+    else:
+        @app.middleware("http")
+        async def exception_middleware(request: Request, call_next):
+            try:
+                return await call_next(request)
+            except Exception as exc:
+                return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+    return app
+
+
+async def run(app: FastAPI, total: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping")
+
+        async def one():
+            async with semaphore:
+                response = await client.get("/ping")
+                response.raise_for_status()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(total)))
+        return total / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    for label, pure_asgi in (("BaseHTTPMiddleware", False), ("pure ASGI", True)):
+        app = build_app(pure_asgi)
+        best = max([await run(app, args.requests, args.concurrency) for _ in range(args.rounds)])
+        print(f"{label:<20} {best:10.1f} req/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,116 @@
+"""Orders/sec: sequential ``POST /orders/`` vs ``POST /orders/batch``.
+
+Usage:
+    python -m benchmarks.bench_order_batch --url sqlite:///./bench.db --orders 1000 --batch-size 250
+
+The real application is driven in-process through ``httpx.ASGITransport``
+with ``get_db`` pointed at ``--url`` and authentication overridden with an
+admin user. Tables are created and seeded with one client and
+``--products`` products; every order has ``--items`` lines. The same
+payloads are first sent one request (and one commit) per order, then in
+batches of ``--batch-size``.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+
+import httpx
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from src.auth.security.token import get_current_user
+from src.clients.models import Client
+from src.common.database import Base, get_async_database_url, get_db
+from src.main import app
+from src.products.models import Product
+
+
+def seed(database_url: str, products: int) -> tuple:
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        client = Client(name="Cliente Bench", cpf="12345678909", email="bench@email.com")
+        db.add(client)
+        db.add_all(
+            Product(
+                name=f"Produto {index}", bar_code=f"BENCH-{index}", price=10.0,
+                stock=10_000_000, valid_date=datetime(2030, 1, 1),
+            )
+            for index in range(products)
+        )
+        db.commit()
+        product_ids = [id_product for (id_product,) in db.query(Product.id_product)]
+        id_client = client.id_client
+
+    engine.dispose()
+    return id_client, product_ids
+
+
+def build_orders(id_client: int, product_ids: list, total: int, items: int) -> list:
+    return [
+        {
+            "id_client": id_client,
+            "status": "pendente",
+            "products": [
+                {"id_product": id_product, "amount": 1}
+                for id_product in random.sample(product_ids, items)
+            ],
+        }
+        for _ in range(total)
+    ]
+
+
+async def sequential(client: httpx.AsyncClient, orders: list) -> float:
+    start = time.perf_counter()
+    for order in orders:
+        response = await client.post("/orders/", json=order)
+        response.raise_for_status()
+    return len(orders) / (time.perf_counter() - start)
+
+
+async def batched(client: httpx.AsyncClient, orders: list, batch_size: int) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(orders), batch_size):
+        response = await client.post("/orders/batch", json={"orders": orders[offset:offset + batch_size]})
+        response.raise_for_status()
+        assert response.json()["failed"] == 0
+    return len(orders) / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="sqlite:///./bench.db")
+    parser.add_argument("--orders", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=250)
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--items", type=int, default=3)
+    args = parser.parse_args()
+
+    id_client, product_ids = seed(args.url, args.products)
+    orders = build_orders(id_client, product_ids, args.orders, args.items)
+
+    engine = create_async_engine(get_async_database_url(args.url))
+    SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    async def bench_db():
+        async with SessionLocal() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = bench_db
+    app.dependency_overrides[get_current_user] = lambda: {"username": "bench", "role": "admin"}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        print(f"{'sequential':<12} {await sequential(client, orders):9.1f} orders/s")
+        print(f"{'batch':<12} {await batched(client, orders, args.batch_size):9.1f} orders/s")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
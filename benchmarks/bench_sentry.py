@@ -0,0 +1,96 @@
+"""Cost of Sentry capture on 4xx-heavy traffic, against a local stand-in DSN sink.
+
+Usage:
+    python -m benchmarks.bench_sentry --requests 2000
+
+A throwaway HTTP server on localhost accepts Sentry envelopes and counts
+them. The same app, whose route raises a 404 HTTPException and captures it
+the way the routers do, is run twice: once with the old settings
+(``traces_sample_rate=1.0`` and ``sentry_sdk.capture_exception`` on every
+HTTPException) and once with ``traces_sampler``, ``before_send`` and the
+filtering ``capture_exception`` from this project.
+"""
+import argparse
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import sentry_sdk
+from fastapi import FastAPI, HTTPException
+from sentry_sdk.integrations.fastapi import FastApiIntegration
+
+from src.common.config import before_send, traces_sampler
+from src.utils import exceptions
+
+
+class EnvelopeSink(BaseHTTPRequestHandler):
+    received = 0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        EnvelopeSink.received += 1
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def build_app(capture) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/products/{id_product}")
+    async def missing_product(id_product: int):
+        try:
+            raise HTTPException(status_code=404, detail=f"Produto ID {id_product} não encontrado")
+        except HTTPException as e:
+            capture(e)
+            raise
+
+    return app
+
+
+async def run(app: FastAPI, total: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for index in range(total):
+            await client.get(f"/products/{index}")
+        return total / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), EnvelopeSink)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    dsn = f"http://public@127.0.0.1:{server.server_address[1]}/1"
+
+    scenarios = {
+        "before": (
+            dict(traces_sample_rate=1.0),
+            sentry_sdk.capture_exception,
+        ),
+        "after": (
+            dict(traces_sampler=traces_sampler, before_send=before_send),
+            exceptions.capture_exception,
+        ),
+    }
+
+    for label, (options, capture) in scenarios.items():
+        sentry_sdk.init(dsn=dsn, integrations=[FastApiIntegration()], **options)
+        EnvelopeSink.received = 0
+
+        rps = await run(build_app(capture), args.requests)
+        sentry_sdk.flush()
+        print(f"{label:<7} {rps:9.1f} req/s  envelopes sent={EnvelopeSink.received}")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
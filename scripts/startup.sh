@@ -12,6 +12,11 @@ if [ "$ENVIRONMENT" = "development" ]; then
     echo "Banco de dados está no ar ..."
 fi
 
+if [ -n "$PROMETHEUS_MULTIPROC_DIR" ]; then
+    rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+    mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+fi
+
 if [ "$ENVIRONMENT" = "production" ]; then
     echo "Aplicando migrations no ambiente de produção..."
     alembic upgrade head
@@ -25,5 +30,5 @@ if [ "$ENVIRONMENT" = "development" ]; then
     uvicorn src.main:app --host 0.0.0.0 --port 8000 --reload
 else
     echo "Rodando em modo PRODUÇÃO..."
-    uvicorn src.main:app --host 0.0.0.0 --port 8000
+    uvicorn src.main:app --host 0.0.0.0 --port 8000 --workers "${WEB_CONCURRENCY:-1}"
 fi
@@ -5,12 +5,13 @@ from fastapi import (
     status,
 )
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
 from datetime import timedelta
 from .security.token import (
-    get_password_hash,
-    verify_password,
+    hash_password,
+    verify_and_update_password,
     create_access_token,
     decode_refresh_token
 )
@@ -22,7 +23,7 @@ from .schemas import (
 )
 from .models import User
 from src.common.database import get_db
-from sentry_sdk import capture_exception
+from src.utils.exceptions import capture_exception
 
 
 auth_router = APIRouter(
@@ -44,9 +45,10 @@ auth_router = APIRouter(
         400: {"description": "Nome de usuário já existe"}
     }
 )
-async def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
+async def register_user(user_data: UserRegister, db: AsyncSession = Depends(get_db)):
     try:
-        existing_user = db.query(User).filter(User.username == user_data.username).first()
+        result = await db.execute(select(User).where(User.username == user_data.username))
+        existing_user = result.scalars().first()
 
         if existing_user:
             raise HTTPException(
@@ -54,7 +56,7 @@ async def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
                 detail=f"Nome de usuário já existe."
             )
         
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password(user_data.password)
         new_user = User(
             username=user_data.username,
             password=hashed_password,
@@ -62,18 +64,21 @@ async def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
         )
 
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         return new_user
 
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -81,7 +86,7 @@ async def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -100,19 +105,31 @@ async def register_user(user_data: UserRegister, db: Session = Depends(get_db)):
 )
 async def login_user_with_form(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
-        user = db.query(User).filter(User.username == form_data.username).first()
+        result = await db.execute(select(User).where(User.username == form_data.username))
+        user = result.scalars().first()
+
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=f"Credenciais inválidas."
+            )
 
-        if not user or not verify_password(form_data.password, user.password):
+        is_valid, upgraded_hash = await verify_and_update_password(form_data.password, user.password)
+        if not is_valid:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail=f"Credenciais inválidas."
             )
 
+        if upgraded_hash:
+            user.password = upgraded_hash
+            await db.commit()
+
         access_token = create_access_token(
-            data={"sub": user.username, "role": user.role}
+            data={"sub": user.username, "role": user.role, "id_user": user.id_user}
         )
         refresh_token = create_access_token(
             data={"sub": user.username}, expires_delta=timedelta(days=7)
@@ -122,12 +139,15 @@ async def login_user_with_form(
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
+
+        raise
 
+    except PoolTimeoutError:
         raise
 
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -135,7 +155,7 @@ async def login_user_with_form(
         )
     
     except Exception as e:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -169,6 +189,9 @@ async def refresh_access_token(payload: TokenRefreshRequest):
         capture_exception(e)
         raise
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
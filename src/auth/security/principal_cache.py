@@ -0,0 +1,73 @@
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+from src.common.cache import TTLCache
+from src.common.config import settings
+from src.auth.models import User
+
+
+class PrincipalCache(TTLCache):
+    def get(self, username: str):
+        principal = super().get(username)
+        return dict(principal) if principal is not None else None
+
+    def set(self, username: str, principal: dict):
+        super().set(username, dict(principal))
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+)
+
+
+CHANGED_PRINCIPALS = "changed_principals"
+ALL_PRINCIPALS = "*"
+
+
+def mark_changed(session: Session, usernames=None):
+    if usernames is None:
+        session.info[CHANGED_PRINCIPALS] = ALL_PRINCIPALS
+        return
+
+    pending = session.info.setdefault(CHANGED_PRINCIPALS, set())
+    if pending != ALL_PRINCIPALS:
+        pending.update(usernames)
+
+
+@event.listens_for(User, "after_update")
+def track_updated_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        mark_changed(session, [target.username, *inspect(target).attrs.username.history.deleted])
+
+
+@event.listens_for(User, "after_delete")
+def track_deleted_user(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        mark_changed(session, [target.username])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_bulk_user_changes(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is User:
+        mark_changed(orm_execute_state.session)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_principals(session):
+    pending = session.info.pop(CHANGED_PRINCIPALS, None)
+    if pending == ALL_PRINCIPALS:
+        principal_cache.clear()
+    elif pending:
+        for username in pending:
+            principal_cache.invalidate(username)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_rolled_back_principals(session):
+    session.info.pop(CHANGED_PRINCIPALS, None)
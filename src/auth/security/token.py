@@ -4,16 +4,27 @@ from passlib.context import CryptContext
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.database import get_db
 from src.auth.models import User
+from .principal_cache import principal_cache
+from .password_pool import PasswordHashPool
 
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 120
 
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+password_pool = PasswordHashPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_QUEUE_SIZE
+)
 
 
 def verify_password(plain_password, hashed_password):
@@ -24,6 +35,14 @@ def get_password_hash(password):
     return pwd_context.hash(password)
 
 
+async def hash_password(password):
+    return await password_pool.run(get_password_hash, password)
+
+
+async def verify_and_update_password(plain_password, hashed_password):
+    return await password_pool.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: timedelta = None):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
@@ -51,9 +70,9 @@ def decode_refresh_token(token: str):
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ) -> dict:
     payload = decode_access_token(token)
     if not payload:
@@ -70,15 +89,29 @@ def get_current_user(
             detail="Credenciais inválidas",
         )
 
-    user = db.query(User).filter(User.username == username).first()
+    if settings.TRUST_TOKEN_ROLE and payload.get("role"):
+        return {
+            "username": username,
+            "role": payload["role"],
+            "id_user": payload.get("id_user")
+        }
+
+    principal = principal_cache.get(username)
+    if principal:
+        return principal
+
+    result = await db.execute(select(User).where(User.username == username))
+    user = result.scalars().first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Usuário não encontrado",
         )
 
-    return {
+    principal = {
         "username": user.username,
         "role": user.role,
         "id_user": user.id_user
     }
+    principal_cache.set(username, principal)
+    return principal
@@ -1,11 +1,19 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, Index
 from sqlalchemy.orm import relationship
-from src.common.database import Base
+from src.common.database import Base, VersionMixin
 from src.orders.models import Order
 
 
-class Client(Base):
+class Client(VersionMixin, Base):
     __tablename__ = "client"
+    __table_args__ = tuple(
+        Index(
+            f"ix_client_{column}_trgm", column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"}
+        )
+        for column in ("name", "email")
+    )
 
     id_client = Column(Integer, primary_key=True, index=True, autoincrement=True)
     name = Column(String(100), nullable=False)
@@ -13,4 +21,4 @@ class Client(Base):
     email = Column(String(100), nullable=False, unique=True, index=True)
     phone = Column(String(20), nullable=True)
     
-    orders = relationship("Order", back_populates="client")
+    orders = relationship("Order", back_populates="client", lazy="raise", passive_deletes=True)
@@ -1,13 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError, TimeoutError as PoolTimeoutError
 from typing import List
 from src.common.database import get_db
 from .models import Client
+from src.orders.models import Order
 from .schemas import ClientCreate, ClientUpdate, ClientResponse
 from src.auth.security.token import get_current_user 
 from src.utils.role_validator import check_admin_permission
-from sentry_sdk import capture_exception
+from src.utils.pagination import decode_cursor, paginate, set_next_cursor
+from src.utils.exceptions import capture_exception
+from src.utils.serialization import RowSerializer, json_response
+from src.common.config import settings
+from src.utils.conditional import (
+    VALIDATOR_FIELDS,
+    detail_not_modified,
+    detail_validators,
+    page_not_modified,
+    page_validators,
+    set_cache_headers,
+)
 
 
 client_router = APIRouter(
@@ -20,6 +33,9 @@ client_router = APIRouter(
 )
 
 
+client_rows = RowSerializer(Client, ClientResponse.model_fields, extra=VALIDATOR_FIELDS)
+
+
 @client_router.post(
     "/",
     response_model=ClientResponse,
@@ -32,7 +48,7 @@ client_router = APIRouter(
 )
 async def post_client(
     client: ClientCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user) 
 ):
     check_admin_permission(current_user)
@@ -40,22 +56,25 @@ async def post_client(
     try:
         db_client = Client(**client.model_dump())
         db.add(db_client)
-        db.commit()
-        db.refresh(db_client)
+        await db.commit()
+        await db.refresh(db_client)
         return db_client
     
     except IntegrityError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"CPF ou email já cadastrado: {e}"
         )
     
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -64,7 +83,7 @@ async def post_client(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -79,29 +98,52 @@ async def post_client(
     responses={200: {"description": "Lista de clientes paginada"}}
 )
 async def get_client(
+    request: Request,
+    response: Response,
     name: str | None = Query(None, example="João"),
     email: str | None = Query(None, example="joao@email.com"),
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description="Cursor opaco retornado em X-Next-Cursor"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user) 
 ):
+    after = decode_cursor(cursor)
+
     try:
-        query = db.query(Client)
-        if name: query = query.filter(Client.name.ilike(f"%{name}%"))
-        if email: query = query.filter(Client.email.ilike(f"%{email}%"))
+        query = client_rows.select() if settings.FAST_JSON_RESPONSES else select(Client)
+        if name: query = query.where(Client.name.ilike(f"%{name}%"))
+        if email: query = query.where(Client.email.ilike(f"%{email}%"))
+
+        page_query = paginate(query, Client.id_client, skip, limit, after)
+        filters = (name, email, skip, limit, after)
+        unchanged = await page_not_modified(db, request, page_query, filters, "id_client")
+        if unchanged is not None:
+            return unchanged
 
-        return query.offset(skip).limit(limit).all()
+        if settings.FAST_JSON_RESPONSES:
+            clients = (await db.execute(page_query)).all()
+        else:
+            clients = (await db.execute(page_query)).scalars().all()
+
+        set_cache_headers(response, *page_validators(filters, clients, "id_client"))
+        set_next_cursor(response, clients, "id_client", limit)
+        if settings.FAST_JSON_RESPONSES:
+            return json_response(client_rows.dump(clients), response.headers)
+        return clients
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise 
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -110,7 +152,7 @@ async def get_client(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -128,12 +170,18 @@ async def get_client(
     }
 )
 async def get_detail_client(
+    request: Request,
+    response: Response,
     id_client: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     try:
-        client = db.get(Client, id_client)
+        unchanged = await detail_not_modified(db, request, Client, Client.id_client, id_client)
+        if unchanged is not None:
+            return unchanged
+
+        client = await db.get(Client, id_client)
         
         if not client:
             raise HTTPException(
@@ -141,17 +189,21 @@ async def get_detail_client(
                 detail=f"Cliente ID {id_client} não encontrado"
             )
         
+        set_cache_headers(response, *detail_validators(Client, id_client, client.version, client.updated_at))
         return client
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise 
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -160,7 +212,7 @@ async def get_detail_client(
 
     except Exception:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -177,12 +229,12 @@ async def get_detail_client(
 async def put_detail_client(
     id_client: int,
     client_update: ClientUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user)
     
-    client = db.get(Client, id_client)
+    client = await db.get(Client, id_client)
     if not client:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -195,27 +247,30 @@ async def put_detail_client(
         for key, value in update_data.items():
             setattr(client, key, value)
 
-        db.commit()
+        await db.commit()
         return client
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise
     
     except IntegrityError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Dados inválidos"
         )
     
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -224,7 +279,7 @@ async def put_detail_client(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -240,39 +295,42 @@ async def put_detail_client(
 )
 async def delete_detail_client(
     id_client: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user) 
     
-    client = db.query(Client).get(id_client)
+    client = await db.get(Client, id_client)
     if not client:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Cliente ID {id_client} não encontrado"
         )
     
-    if client.orders:
+    if await db.scalar(select(exists().where(Order.id_client == id_client))):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Não é possível excluir clientes com pedidos associados"
         )
     
     try:
-        db.delete(client)
-        db.commit()
+        await db.delete(client)
+        await db.commit()
         
         return client
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise 
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -281,7 +339,7 @@ async def delete_detail_client(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
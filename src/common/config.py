@@ -1,8 +1,10 @@
+import os
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.sqlalchemy import SqlalchemyIntegration
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
+from src.utils.exceptions import is_expected_error
 
 
 class Settings(BaseSettings):
@@ -10,11 +12,66 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     SECRET_KEY: str
     SENTRY_DNS: str
+    ENVIRONMENT: str = "development"
+    DEBUG: bool = False
+    N_PLUS_ONE_THRESHOLD: int = 10
+    SENTRY_TRACES_SAMPLE_RATE: float = 0.1
+    SENTRY_PROFILES_SAMPLE_RATE: float = 0.0
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 5.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_WARMUP: int = 2
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    PRINCIPAL_CACHE_TTL: int = 60
+    PRODUCT_CACHE_SIZE: int = 2048
+    PRODUCT_CACHE_TTL: int = 30
+    COALESCE_TIMEOUT: float = 2.0
+    FAST_JSON_RESPONSES: bool = False
+    TRUST_TOKEN_ROLE: bool = False
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_QUEUE_SIZE: int = 32
+    PROMETHEUS_MULTIPROC_DIR: str = ""
+    IDEMPOTENCY_KEY_TTL: int = 86400
     model_config = ConfigDict(env_file="dotenv/.env")
 
 settings = Settings()
 
 
+def configure_multiprocess_metrics():
+    if settings.PROMETHEUS_MULTIPROC_DIR:
+        os.makedirs(settings.PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = settings.PROMETHEUS_MULTIPROC_DIR
+
+
+configure_multiprocess_metrics()
+
+
+UNSAMPLED_PATH_PREFIXES = ("/docs", "/redoc", "/openapi.json", "/media", "/health", "/metrics")
+
+
+def traces_sampler(sampling_context):
+    path = sampling_context.get("asgi_scope", {}).get("path", "")
+    if path.startswith(UNSAMPLED_PATH_PREFIXES):
+        return 0.0
+
+    parent_sampled = sampling_context.get("parent_sampled")
+    if parent_sampled is not None:
+        return float(parent_sampled)
+
+    return settings.SENTRY_TRACES_SAMPLE_RATE
+
+
+def before_send(event, hint):
+    exc_info = hint.get("exc_info")
+    if exc_info and is_expected_error(exc_info[1]):
+        return None
+
+    return event
+
+
 def init_sentry():
     sentry_sdk.init(
         dsn=settings.SENTRY_DNS,
@@ -22,7 +79,9 @@ def init_sentry():
             FastApiIntegration(),
             SqlalchemyIntegration(),
         ],
-        traces_sample_rate=1.0,  
-        environment="development",
+        traces_sampler=traces_sampler,
+        profiles_sample_rate=settings.SENTRY_PROFILES_SAMPLE_RATE,
+        environment=settings.ENVIRONMENT,
+        before_send=before_send,
         ignore_errors=[KeyboardInterrupt],  
     )
@@ -1,22 +1,96 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+from time import perf_counter
+from sqlalchemy import Column, DateTime, Integer, func, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncAttrs, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from ..common.config import settings
+from ..common.metrics import POOL_CHECKOUT_SECONDS, POOL_TIMEOUTS, instrument_pool
 
 
-Base = declarative_base()
+Base = declarative_base(cls=AsyncAttrs)
 
 
-engine = create_engine(settings.DATABASE_URL, future=True)
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+class VersionMixin:
+    version = Column(Integer, nullable=False, default=1, server_default="1", onupdate=text("version + 1"))
+    updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
+    __mapper_args__ = {"eager_defaults": True}
 
 
-def get_db():
-    db = SessionLocal()
-    try:
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+
+    if backend in ASYNC_DRIVERS:
+        url = url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}")
+
+    return url.render_as_string(hide_password=False)
+
+
+class PoolStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.checkout_seconds_total = 0.0
+        self.checkout_seconds_max = 0.0
+
+    def record_checkout(self, seconds: float):
+        self.checkouts += 1
+        self.checkout_seconds_total += seconds
+        self.checkout_seconds_max = max(self.checkout_seconds_max, seconds)
+        POOL_CHECKOUT_SECONDS.observe(seconds)
+
+    def record_timeout(self):
+        self.timeouts += 1
+        POOL_TIMEOUTS.inc()
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    def _do_get(self):
+        start = perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_stats.record_timeout()
+            raise
+
+        pool_stats.record_checkout(perf_counter() - start)
+        return connection
+
+
+engine = create_async_engine(
+    get_async_database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+)
+instrument_pool(engine.sync_engine)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_db_engine():
-    engine.connect()
+async def create_db_engine():
+    connections = []
+    try:
+        for _ in range(min(settings.DB_POOL_WARMUP, settings.DB_POOL_SIZE)):
+            connections.append(await engine.connect())
+    finally:
+        for connection in connections:
+            await connection.close()
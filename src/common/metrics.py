@@ -0,0 +1,181 @@
+import logging
+import os
+import re
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from time import perf_counter
+from fastapi import APIRouter, Response
+from src.common.config import settings
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+
+REQUESTS = Counter(
+    "http_requests_total", "Requisições HTTP", ["method", "route", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP", ["method", "route"]
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress", "Requisições HTTP em andamento", ["method"],
+    multiprocess_mode="livesum"
+)
+REQUEST_DB_QUERIES = Histogram(
+    "http_request_db_queries", "Consultas SQL por requisição", ["route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+)
+REQUEST_DB_SECONDS = Histogram(
+    "http_request_db_seconds", "Tempo em SQL por requisição", ["route"]
+)
+COALESCED_REQUESTS = Counter(
+    "http_coalesced_requests_total", "Requisições atendidas por uma computação em andamento", ["route"]
+)
+COALESCE_TIMEOUTS = Counter(
+    "http_coalesce_timeouts_total", "Requisições que desistiram de esperar a computação compartilhada", ["route"]
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out", "Conexões do pool em uso", multiprocess_mode="livesum"
+)
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections", "Conexões abertas pelo pool", multiprocess_mode="livesum"
+)
+POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds", "Tempo de espera por conexão do pool",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+)
+POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total", "Requisições rejeitadas por pool esgotado"
+)
+
+
+PLACEHOLDER_LIST = re.compile(r"\((?:\s*(?:\?|%\(\w+\)s|\$\d+|:\w+)\s*,?)+\)")
+
+
+def statement_shape(statement: str) -> str:
+    return PLACEHOLDER_LIST.sub("(?)", " ".join(statement.split()))
+
+
+class QueryStats:
+    def __init__(self, path: str = ""):
+        self.path = path
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = StatementCounter()
+
+    def record(self, statement: str, seconds: float):
+        self.count += 1
+        self.seconds += seconds
+
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        if self.shapes[shape] == settings.N_PLUS_ONE_THRESHOLD + 1:
+            logger.warning(
+                "Possível N+1 em %s: consulta executada mais de %d vezes: %s",
+                self.path, settings.N_PLUS_ONE_THRESHOLD, shape,
+            )
+
+    def server_timing(self, total_seconds: float) -> str:
+        return (
+            f'db;dur={self.seconds * 1000:.1f};desc="{self.count} queries", '
+            f"total;dur={total_seconds * 1000:.1f}"
+        )
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_query(conn, cursor, statement, parameters, context, executemany):
+    elapsed = perf_counter() - conn.info["query_start"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+
+def instrument_pool(sync_engine: Engine):
+    event.listen(sync_engine, "connect", lambda *args: POOL_CONNECTIONS.inc())
+    event.listen(sync_engine, "close", lambda *args: POOL_CONNECTIONS.dec())
+    event.listen(sync_engine, "checkout", lambda *args: POOL_CHECKED_OUT.inc())
+    event.listen(sync_engine, "checkin", lambda *args: POOL_CHECKED_OUT.dec())
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        stats = QueryStats(scope["path"])
+        token = current_query_stats.set(stats)
+        start = perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if settings.DEBUG:
+                    timing = stats.server_timing(perf_counter() - start)
+                    message["headers"] = [
+                        *message.get("headers", []), (b"server-timing", timing.encode("latin-1"))
+                    ]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.labels(method).inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = perf_counter() - start
+            current_query_stats.reset(token)
+            REQUESTS_IN_PROGRESS.labels(method).dec()
+
+            route = scope.get("route")
+            route_path = getattr(route, "path", "unmatched")
+            REQUESTS.labels(method, route_path, str(status_code)).inc()
+            REQUEST_LATENCY.labels(method, route_path).observe(elapsed)
+            REQUEST_DB_QUERIES.labels(route_path).observe(stats.count)
+            REQUEST_DB_SECONDS.labels(route_path).observe(stats.seconds)
+
+
+def is_multiprocess() -> bool:
+    return bool(settings.PROMETHEUS_MULTIPROC_DIR)
+
+
+def mark_process_dead():
+    if is_multiprocess():
+        multiprocess.mark_process_dead(os.getpid())
+
+
+metrics_router = APIRouter(tags=["Observabilidade"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    registry = REGISTRY
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
@@ -2,19 +2,25 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from src.common.config import settings, init_sentry
-from src.common.database import create_db_engine
+from src.common.database import create_db_engine, engine
+from src.common.metrics import MetricsMiddleware, mark_process_dead, metrics_router
 from src.clients.routers import client_router
 from src.auth.routers import auth_router
 from src.products.routers import product_router
+from src.products.cache import start_invalidation_listener
 from src.orders.routers import order_router
-from src.utils.exceptions import sentry_exception_middleware, register_exception_handlers
-from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
+from src.utils.exceptions import SentryExceptionMiddleware, register_exception_handlers
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    create_db_engine()
+    await create_db_engine()
+    listener = await start_invalidation_listener()
     yield
+    if listener is not None:
+        await listener.close()
+    await engine.dispose()
+    mark_process_dead()
 
 
 app = FastAPI(
@@ -31,15 +37,17 @@ app.include_router(client_router)
 app.include_router(auth_router)
 app.include_router(product_router)
 app.include_router(order_router)
+app.include_router(metrics_router)
 
-app.add_middleware(SentryAsgiMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"], 
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Server-Timing", "Idempotent-Replayed", "ETag", "Last-Modified"],
 )
 
-sentry_exception_middleware(app)
+app.add_middleware(SentryExceptionMiddleware)
+app.add_middleware(MetricsMiddleware)
 register_exception_handlers(app)
@@ -0,0 +1,87 @@
+from collections import Counter
+from datetime import datetime, timezone
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.clients.models import Client
+from src.orders.models import Order, OrderItem
+from src.orders.schemas import OrderBatchReport, OrderBatchResult, OrderCreate
+from src.orders.stock import apply_stock_deltas, count_amounts, select_products_for_update
+
+
+def check_order(order: OrderCreate, clients: set, products: dict, available: dict):
+    if order.id_client not in clients:
+        return f"Cliente ID {order.id_client} não encontrado"
+
+    amounts = count_amounts(order.products)
+    for id_product, amount in sorted(amounts.items()):
+        if id_product not in products:
+            return f"Produto ID {id_product} não encontrado"
+
+        if available[id_product] < amount:
+            return f"Estoque insuficiente Produto ID {id_product} (Quantidade em estoque {available[id_product]})"
+
+    return None
+
+
+async def create_orders(db: AsyncSession, orders: list) -> OrderBatchReport:
+    client_ids = {order.id_client for order in orders}
+    clients = set((await db.scalars(
+        select(Client.id_client).where(Client.id_client.in_(client_ids))
+    )).all())
+
+    products = await select_products_for_update(
+        db, {item.id_product for order in orders for item in order.products}
+    )
+    available = {id_product: product.stock for id_product, product in products.items()}
+
+    results = []
+    accepted = []
+    reserved = Counter()
+    for index, order in enumerate(orders):
+        detail = check_order(order, clients, products, available)
+        results.append(OrderBatchResult(index=index, detail=detail))
+        if detail:
+            continue
+
+        for item in order.products:
+            available[item.id_product] -= item.amount
+            reserved[item.id_product] += item.amount
+        accepted.append((index, order))
+
+    if accepted:
+        await apply_stock_deltas(db, products, reserved)
+
+        created_at = datetime.now(timezone.utc)
+        order_ids = (await db.scalars(
+            insert(Order).returning(Order.id_order, sort_by_parameter_order=True),
+            [
+                {
+                    "id_client": order.id_client,
+                    "status": order.status.value,
+                    "total_amount": sum(item.amount for item in order.products),
+                    "total_price": sum(products[item.id_product].price * item.amount for item in order.products),
+                    "created_at": created_at,
+                }
+                for _, order in accepted
+            ],
+        )).all()
+
+        await db.execute(insert(OrderItem), [
+            {
+                "id_order": id_order,
+                "id_product": item.id_product,
+                "amount": item.amount,
+                "unit_price": products[item.id_product].price,
+            }
+            for id_order, (_, order) in zip(order_ids, accepted)
+            for item in order.products
+        ])
+
+        for id_order, (index, _) in zip(order_ids, accepted):
+            results[index].id_order = id_order
+
+    return OrderBatchReport(
+        created=len(accepted),
+        failed=len(orders) - len(accepted),
+        results=results,
+    )
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.orders.models import Order, OrderItem
+
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_COLUMNS = [
+    Order.id_order,
+    Order.id_client,
+    Order.status,
+    Order.created_at,
+    Order.total_amount,
+    Order.total_price,
+    OrderItem.id_orderitem,
+    OrderItem.id_product,
+    OrderItem.amount,
+    OrderItem.unit_price,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+EXPORT_MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def build_export_query(filters):
+    query = (
+        select(*EXPORT_COLUMNS)
+        .outerjoin(OrderItem, OrderItem.id_order == Order.id_order)
+        .order_by(Order.id_order, OrderItem.id_orderitem)
+    )
+    return filters.apply(query)
+
+
+def encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def format_csv(rows, header: bool) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(EXPORT_FIELDS)
+    writer.writerows([encode_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+def format_ndjson(rows, header: bool) -> str:
+    return "".join(
+        json.dumps(dict(zip(EXPORT_FIELDS, map(encode_value, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+FORMATTERS = {
+    "csv": format_csv,
+    "ndjson": format_ndjson,
+}
+
+
+async def stream_orders(db: AsyncSession, query, format: str):
+    formatter = FORMATTERS[format]
+    header = True
+
+    result = await db.stream(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+    async for rows in result.partitions():
+        yield formatter(rows, header)
+        header = False
+
+    if header and format == "csv":
+        yield formatter([], header)
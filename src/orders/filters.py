@@ -0,0 +1,59 @@
+from fastapi import Query
+from sqlalchemy import select
+from typing import Optional
+from datetime import datetime
+from src.orders.models import Order, OrderItem
+from src.products.models import Product
+
+
+class OrderFilters:
+    def __init__(
+        self,
+        id_order: Optional[int] = Query(None, example=1, description="Filtrar por ID do pedido"),
+        id_product: Optional[int] = Query(None, example=1, description="Filtrar por ID do produto"),
+        id_client: Optional[int] = Query(None, example=1, description="Filtrar por ID do cliente"),
+        status: Optional[str] = Query(None, example="pendente", description="Status do pedido"),
+        section: Optional[str] = Query(None, example="eletrônicos", description="Seção dos produtos"),
+        start_date: Optional[datetime] = Query(None, example="2024-01-01T00:00:00Z", description="Data inicial"),
+        end_date: Optional[datetime] = Query(None, example="2024-12-31T23:59:59Z", description="Data final"),
+    ):
+        self.id_order = id_order
+        self.id_product = id_product
+        self.id_client = id_client
+        self.status = status
+        self.section = section
+        self.start_date = start_date
+        self.end_date = end_date
+
+    def apply(self, query):
+        if self.id_order:
+            query = query.where(Order.id_order == self.id_order)
+
+        if self.id_client:
+            query = query.where(Order.id_client == self.id_client)
+
+        if self.status:
+            query = query.where(Order.status == self.status)
+
+        if self.section:
+            query = query.where(Order.id_order.in_(
+                select(OrderItem.id_order)
+                .join(Product, Product.id_product == OrderItem.id_product)
+                .where(Product.section.ilike(f"%{self.section}%"))
+            ))
+
+        if self.id_product:
+            query = query.where(Order.id_order.in_(
+                select(OrderItem.id_order).where(OrderItem.id_product == self.id_product)
+            ))
+
+        if self.start_date and self.end_date:
+            query = query.where(Order.created_at.between(self.start_date, self.end_date))
+
+        elif self.start_date:
+            query = query.where(Order.created_at >= self.start_date)
+
+        elif self.end_date:
+            query = query.where(Order.created_at <= self.end_date)
+
+        return query
@@ -0,0 +1,117 @@
+import json
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from typing import Optional
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.common.config import settings
+from src.orders.models import IdempotencyKey
+
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+IDEMPOTENT_REPLAY_HEADER = "Idempotent-Replayed"
+PURGE_BATCH_SIZE = 500
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def expiry_cutoff() -> datetime:
+    return utcnow() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+
+
+def request_fingerprint(payload: BaseModel) -> str:
+    return sha256(payload.model_dump_json().encode()).hexdigest()
+
+
+async def find_stored_response(
+    db: AsyncSession, key: str, username: str, fingerprint: str
+) -> Optional[JSONResponse]:
+    record = await db.scalar(
+        select(IdempotencyKey).where(
+            IdempotencyKey.key == key,
+            IdempotencyKey.username == username,
+            IdempotencyKey.created_at >= expiry_cutoff(),
+        )
+    )
+    if record is None:
+        return None
+
+    if record.request_hash != fingerprint:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"{IDEMPOTENCY_KEY_HEADER} já utilizada com outro conteúdo"
+        )
+
+    return JSONResponse(
+        content=json.loads(record.response_body),
+        status_code=record.status_code,
+        headers={IDEMPOTENT_REPLAY_HEADER: "true"},
+    )
+
+
+async def purge_expired_keys(db: AsyncSession):
+    expired = (
+        select(IdempotencyKey.id_idempotency_key)
+        .where(IdempotencyKey.created_at < expiry_cutoff())
+        .limit(PURGE_BATCH_SIZE)
+        .with_for_update(skip_locked=True)
+    )
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.id_idempotency_key.in_(expired.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def begin_idempotent_request(
+    db: AsyncSession, key: str, username: str, fingerprint: str
+) -> Optional[JSONResponse]:
+    await purge_expired_keys(db)
+
+    stored = await find_stored_response(db, key, username, fingerprint)
+    if stored is not None:
+        return stored
+
+    await db.execute(
+        delete(IdempotencyKey)
+        .where(
+            IdempotencyKey.key == key,
+            IdempotencyKey.username == username,
+            IdempotencyKey.created_at < expiry_cutoff(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    db.add(IdempotencyKey(
+        key=key, username=username, request_hash=fingerprint, created_at=utcnow()
+    ))
+    try:
+        await db.flush()
+    except IntegrityError:
+        await db.rollback()
+        stored = await find_stored_response(db, key, username, fingerprint)
+        if stored is None:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Requisição com a mesma {IDEMPOTENCY_KEY_HEADER} em processamento, tente novamente",
+                headers={"Retry-After": "1"},
+            )
+        return stored
+
+    return None
+
+
+async def store_idempotent_response(
+    db: AsyncSession, key: str, username: str, status_code: int, body: BaseModel
+):
+    await db.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == key, IdempotencyKey.username == username)
+        .values(status_code=status_code, response_body=body.model_dump_json())
+        .execution_options(synchronize_session=False)
+    )
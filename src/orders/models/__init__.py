@@ -1,4 +1,5 @@
 from .order import Order
 from .orderitem import OrderItem
+from .idempotency import IdempotencyKey
 
-__all__ = ["Order", "OrderItem"]
\ No newline at end of file
+__all__ = ["Order", "OrderItem", "IdempotencyKey"]
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, UniqueConstraint
+from src.common.database import Base
+
+
+class IdempotencyKey(Base):
+    __tablename__ = "idempotency_key"
+    __table_args__ = (
+        UniqueConstraint("key", "username", name="uq_idempotency_key_key_username"),
+    )
+
+    id_idempotency_key = Column(Integer, primary_key=True, autoincrement=True)
+    key = Column(String(255), nullable=False)
+    username = Column(String(50), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, index=True)
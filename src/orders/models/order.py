@@ -1,17 +1,21 @@
-from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, String
+from sqlalchemy import Column, Integer, ForeignKey, Float, DateTime, String, Index
 from sqlalchemy.orm import relationship
-from src.common.database import Base
+from src.common.database import Base, VersionMixin
 
 
-class Order(Base):
+class Order(VersionMixin, Base):
     __tablename__ = "order"
+    __table_args__ = (
+        Index("ix_order_id_client_id_order", "id_client", "id_order"),
+        Index("ix_order_status_id_order", "status", "id_order"),
+    )
 
     id_order = Column(Integer, primary_key=True, index=True, autoincrement=True)
     id_client = Column(Integer, ForeignKey('client.id_client'), nullable=False)
     total_amount = Column(Integer, nullable=False)
     total_price = Column(Float, nullable=False)
-    created_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime, nullable=True, index=True)
     status = Column(String(20), nullable=False)
     
-    client = relationship("Client", back_populates="orders")
+    client = relationship("Client", back_populates="orders", lazy="raise")
     items = relationship("OrderItem", back_populates="order", cascade="all, delete")
@@ -1,21 +1,62 @@
 from fastapi import (
     APIRouter, 
     Depends, 
+    Header,
     HTTPException, 
     Query, 
+    Request,
+    Response,
     status)
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
-from typing import List, Optional
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.exc import SQLAlchemyError, TimeoutError as PoolTimeoutError
+from typing import List, Optional, Union
 from datetime import datetime, timezone
 from src.common.database import get_db
 from src.auth.security.token import get_current_user
 from src.orders.models import Order, OrderItem
-from src.products.models import Product
 from src.clients.models import Client
-from src.orders.schemas import OrderCreate, OrderResponse, OrderUpdate
+from src.orders.schemas import (
+    OrderBatchCreate,
+    OrderBatchReport,
+    OrderCreate,
+    OrderDeleteBatchResponse,
+    OrderResponse,
+    OrderSummaryResponse,
+    OrderUpdate,
+    OrderView,
+)
+from src.orders.stock import apply_stock_deltas, count_amounts, delete_orders, diff_amounts, lock_products
+from src.orders.batch import create_orders
+from src.orders.filters import OrderFilters
+from src.orders.idempotency import (
+    IDEMPOTENCY_KEY_HEADER,
+    begin_idempotent_request,
+    request_fingerprint,
+    store_idempotent_response,
+)
+from src.orders.export import EXPORT_MEDIA_TYPES, build_export_query, stream_orders
+from src.orders.serialization import (
+    SUMMARY_FIELDS,
+    dump_order_page,
+    dump_orders,
+    order_rows,
+    sparse_load_options,
+)
+from src.common.config import settings
 from src.utils.role_validator import check_admin_permission
-from sentry_sdk import capture_exception
+from src.utils.pagination import decode_cursor, paginate, set_next_cursor
+from src.utils.exceptions import capture_exception
+from src.utils.serialization import json_response
+from src.utils.conditional import (
+    detail_not_modified,
+    detail_validators,
+    page_not_modified,
+    page_validators,
+    set_cache_headers,
+)
 
 
 order_router = APIRouter(
@@ -29,6 +70,75 @@ order_router = APIRouter(
 )
 
 
+ORDER_EXPANSIONS = {"items", "client", "products"}
+UNVERSIONED_EXPANSIONS = {"client", "products"}
+MAX_BATCH_DELETE = 500
+
+
+def parse_expansions(include: str) -> set:
+    expansions = {value.strip() for value in include.split(",") if value.strip()}
+    invalid = expansions - ORDER_EXPANSIONS
+    if invalid:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Valores inválidos em include: {', '.join(sorted(invalid))}"
+        )
+    return expansions
+
+
+def parse_fields(fields: Optional[str], view: OrderView) -> Optional[tuple]:
+    if view == OrderView.SUMMARY:
+        if fields:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Use fields ou view=summary, não ambos"
+            )
+        return SUMMARY_FIELDS
+
+    if not fields:
+        return None
+
+    requested = {value.strip() for value in fields.split(",") if value.strip()}
+    invalid = requested - set(OrderResponse.model_fields)
+    if invalid or not requested:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Valores inválidos em fields: {', '.join(sorted(invalid)) or fields}"
+        )
+    return tuple(name for name in OrderResponse.model_fields if name in requested)
+
+
+def prune_expansions(expansions: set, fields: Optional[tuple]) -> set:
+    if fields is None:
+        return expansions
+
+    expansions = expansions | ({"items", "client"} & set(fields))
+    if "items" not in fields:
+        expansions = expansions - {"items", "products"}
+    if "client" not in fields:
+        expansions = expansions - {"client"}
+    return expansions
+
+
+def order_loader_options(expansions: set) -> list:
+    options = []
+    if "products" in expansions:
+        options.append(selectinload(Order.items).joinedload(OrderItem.product))
+    elif "items" in expansions:
+        options.append(selectinload(Order.items))
+    else:
+        options.append(raiseload(Order.items))
+
+    if "client" in expansions:
+        options.append(joinedload(Order.client))
+
+    return options
+
+
+def has_order_validators(expansions: set) -> bool:
+    return not UNVERSIONED_EXPANSIONS & expansions
+
+
 @order_router.post(
     "/",
     response_model=OrderResponse,
@@ -36,42 +146,46 @@ order_router = APIRouter(
     summary="Criar novo pedido",
     responses={
         400: {"description": "Estoque insuficiente ou dados inválidos"},
-        404: {"description": "Produto não encontrado"}
+        404: {"description": "Produto não encontrado"},
+        409: {"description": "Requisição com a mesma Idempotency-Key em processamento"},
+        422: {"description": "Idempotency-Key reutilizada com outro conteúdo"}
     }
 )
 async def post_order(
     order: OrderCreate,
-    db: Session = Depends(get_db),
+    idempotency_key: Optional[str] = Header(
+        None, alias=IDEMPOTENCY_KEY_HEADER, max_length=255,
+        description="Chave para repetir a requisição sem criar outro pedido"
+    ),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user)
     
     try:
+        if idempotency_key:
+            stored = await begin_idempotent_request(
+                db, idempotency_key, current_user["username"], request_fingerprint(order)
+            )
+            if stored is not None:
+                return stored
+
         total_price = 0
         total_amount = 0
         order_items = []
 
-        if not db.query(Client).get(order.id_client):
+        if not await db.get(Client, order.id_client):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Cliente ID {order.id_client} não encontrado"
             )
 
-        for item in order.products:
-            product = db.query(Product).get(item.id_product)
-            if not product:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Produto ID {item.id_product} não encontrado"
-                )
+        amounts = count_amounts(order.products)
+        products = await lock_products(db, amounts)
+        await apply_stock_deltas(db, products, amounts)
 
-            if product.stock < item.amount:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Estoque insuficiente Produto ID {product.id_product} (Quantidade em estoque {product.stock})"
-                )
-
-            product.stock -= item.amount
+        for item in order.products:
+            product = products[item.id_product]
             total_price += product.price * item.amount
             total_amount += item.amount
 
@@ -91,19 +205,29 @@ async def post_order(
         )
 
         db.add(new_order)
-        db.commit()
-        db.refresh(new_order)
+        if idempotency_key:
+            await db.flush()
+            await store_idempotent_response(
+                db, idempotency_key, current_user["username"],
+                status.HTTP_201_CREATED, OrderResponse.model_validate(new_order)
+            )
+
+        await db.commit()
+        await db.refresh(new_order, ["items"])
         return new_order
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -112,7 +236,7 @@ async def post_order(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -120,57 +244,108 @@ async def post_order(
         )
 
 
-@order_router.get(
-    "/",
-    response_model=List[OrderResponse],
-    summary="Listar pedidos com filtros",
-    responses={200: {"description": "Lista de pedidos paginada"}}
+@order_router.post(
+    "/batch",
+    response_model=OrderBatchReport,
+    status_code=status.HTTP_201_CREATED,
+    summary="Criar pedidos em lote",
+    responses={
+        201: {"description": "Resultado por pedido; pedidos inválidos são ignorados"}
+    }
 )
-async def get_order(
-    id_order: Optional[int] = Query(None, example=1, description="Filtrar por ID do pedido"),
-    id_product: Optional[int] = Query(None, example=1, description="Filtrar por ID do produto"),
-    id_client: Optional[int] = Query(None, example=1, description="Filtrar por ID do cliente"),
-    status: Optional[str] = Query(None, example="pendente", description="Status do pedido"),
-    section: Optional[str] = Query(None, example="eletrônicos", description="Seção dos produtos"),
-    start_date: Optional[datetime] = Query(None, example="2024-01-01T00:00:00Z", description="Data inicial"),
-    end_date: Optional[datetime] = Query(None, example="2024-12-31T23:59:59Z", description="Data final"),
-    skip: int = Query(0, ge=0, example=0),
-    limit: int = Query(10, ge=1, le=100, example=10),
-    db: Session = Depends(get_db),
+async def post_orders_batch(
+    batch: OrderBatchCreate,
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
-    try:
-        query = db.query(Order)
+    check_admin_permission(current_user)
 
-        if id_order:
-            query = query.filter(Order.id_order == id_order)
+    try:
+        report = await create_orders(db, batch.orders)
+        await db.commit()
+        return report
 
-        if id_client:
-            query = query.filter(Order.id_client == id_client)
+    except HTTPException as e:
+        capture_exception(e)
+        await db.rollback()
 
-        if status:
-            query = query.filter(Order.status == status)
+        raise
 
-        if section:
-            query = query.join(Order.items).join(OrderItem.product).filter(Product.section.ilike(f"%{section}%"))
+    except PoolTimeoutError:
+        raise
 
-        if id_product:
-            query = query.join(Order.items).filter(OrderItem.id_product == id_product)
+    except SQLAlchemyError as e:
+        capture_exception(e)
+        await db.rollback()
 
-        if start_date and end_date:
-            query = query.filter(Order.created_at.between(start_date, end_date))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro inesperado no banco de dados: {e}"
+        )
 
-        elif start_date:
-            query = query.filter(Order.created_at >= start_date)
 
-        elif end_date:
-            query = query.filter(Order.created_at <= end_date)
+@order_router.get(
+    "/",
+    response_model=None,
+    summary="Listar pedidos com filtros",
+    responses={
+        200: {
+            "description": "Lista de pedidos paginada. Com fields, apenas os campos pedidos de OrderResponse; "
+                           "com view=summary, OrderSummaryResponse",
+            "model": Union[List[OrderResponse], List[OrderSummaryResponse]],
+        }
+    }
+)
+async def get_order(
+    request: Request,
+    response: Response,
+    filters: OrderFilters = Depends(),
+    skip: int = Query(0, ge=0, example=0),
+    limit: int = Query(10, ge=1, le=100, example=10),
+    include: str = Query("items", example="items,client,products", description="Relacionamentos a incluir: items, client, products"),
+    fields: Optional[str] = Query(None, example="id_order,status,total_price", description="Campos do pedido a retornar"),
+    view: OrderView = Query(OrderView.FULL, description="summary retorna apenas os campos de OrderSummaryResponse, sem itens"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em X-Next-Cursor"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    response_fields = parse_fields(fields, view)
+    expansions = prune_expansions(parse_expansions(include), response_fields)
+    loader_options = order_loader_options(expansions)
+    if response_fields is not None:
+        loader_options += sparse_load_options(response_fields)
+    fast_json = settings.FAST_JSON_RESPONSES and response_fields is None and expansions <= {"items"}
+    after = decode_cursor(cursor)
 
-        return query.offset(skip).limit(limit).all()
+    try:
+        query = filters.apply(order_rows.select() if fast_json else select(Order).options(*loader_options))
+        page_query = paginate(query, Order.id_order, skip, limit, after)
+        versioned = has_order_validators(expansions)
+        page_filters = (tuple(sorted(vars(filters).items())), skip, limit, tuple(sorted(expansions)), response_fields, after)
+
+        if versioned:
+            unchanged = await page_not_modified(db, request, page_query, page_filters, "id_order")
+            if unchanged is not None:
+                return unchanged
+
+        if fast_json:
+            orders = (await db.execute(page_query)).all()
+        else:
+            orders = (await db.execute(page_query)).scalars().unique().all()
+
+        if versioned:
+            set_cache_headers(response, *page_validators(page_filters, orders, "id_order"))
+        set_next_cursor(response, orders, "id_order", limit)
+        if fast_json:
+            return json_response(await dump_order_page(db, orders, "items" in expansions), response.headers)
+        return json_response(dump_orders(orders, response_fields), response.headers)
+
+    except PoolTimeoutError:
+        raise
 
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -179,7 +354,7 @@ async def get_order(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -187,6 +362,32 @@ async def get_order(
         )
 
 
+@order_router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Exportar histórico de pedidos com itens",
+    responses={
+        200: {
+            "description": "Uma linha por item de pedido",
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}
+        }
+    }
+)
+async def export_orders(
+    format: str = Query("csv", pattern="^(csv|ndjson)$", description="Formato de saída"),
+    filters: OrderFilters = Depends(),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    query = build_export_query(filters)
+
+    return StreamingResponse(
+        stream_orders(db, query, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="orders.{format}"'}
+    )
+
+
 @order_router.get(
     "/{id_order}",
     response_model=OrderResponse,
@@ -194,29 +395,47 @@ async def get_order(
     responses={404: {"description": "Pedido não encontrado"}}
 )
 async def get_detail_order(
+    request: Request,
+    response: Response,
     id_order: int,
-    db: Session = Depends(get_db),
+    include: str = Query("items", example="items,client,products", description="Relacionamentos a incluir: items, client, products"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    expansions = parse_expansions(include)
+    loader_options = order_loader_options(expansions)
+    versioned = has_order_validators(expansions)
+
     try: 
-        order = db.get(Order, id_order)
+        if versioned:
+            unchanged = await detail_not_modified(db, request, Order, Order.id_order, id_order)
+            if unchanged is not None:
+                return unchanged
+
+        order = await db.get(Order, id_order, options=loader_options)
 
         if not order:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Pedido ID {id_order} não encontrado"
             )
+
+        if versioned:
+            set_cache_headers(response, *detail_validators(Order, id_order, order.version, order.updated_at))
         return order
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise
     
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -225,7 +444,7 @@ async def get_detail_order(
 
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -245,12 +464,14 @@ async def get_detail_order(
 async def put_detail_order(
     id_order: int,
     order_update: OrderUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user)
     try:
-        order = db.get(Order, id_order)
+        order = await db.get(
+            Order, id_order, options=[selectinload(Order.items)], with_for_update=True
+        )
         if not order:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -258,7 +479,7 @@ async def put_detail_order(
             )
 
         if order_update.id_client:
-            if not db.query(Client).get(order_update.id_client):
+            if not await db.get(Client, order_update.id_client):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Cliente ID {order_update.id_client} não encontrado"
@@ -269,55 +490,55 @@ async def put_detail_order(
             order.status = order_update.status
 
         if order_update.products:
-            for item in order.items:
-                product = db.query(Product).get(item.id_product)
-                product.stock += item.amount
-                db.delete(item)
-            
-            total_price = 0
-            total_amount = 0
-            new_items = []
-            
-            for item_data in order_update.products:
-                product = db.query(Product).get(item_data.id_product)
-                if not product:
-                    raise HTTPException(
-                        status_code=status.HTTP_404_NOT_FOUND,
-                        detail=f"Produto ID {item_data.id_product} não encontrado"
-                    )
-                
-                if product.stock < item_data.amount:
-                    raise HTTPException(
-                        status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Estoque insuficiente Produto ID {product.id_product} (Quantidade em estoque {product.stock})"
-                    )
-                
-                product.stock -= item_data.amount
-                total_price += product.price * item_data.amount
-                total_amount += item_data.amount
-                
-                new_items.append(OrderItem(
-                    id_product=item_data.id_product,
-                    amount=item_data.amount,
-                    unit_price=product.price
-                ))
-            
-            order.items = new_items
-            order.total_price = total_price
-            order.total_amount = total_amount
-
-        db.commit()
+            requested = count_amounts(order_update.products)
+            deltas = diff_amounts(count_amounts(order.items), requested)
+            products = await lock_products(db, deltas)
+            await apply_stock_deltas(db, products, deltas)
+
+            lines = {}
+            for item in list(order.items):
+                if item.id_product not in requested:
+                    order.items.remove(item)
+                    await db.delete(item)
+                elif item.id_product in deltas:
+                    if item.id_product in lines:
+                        order.items.remove(item)
+                        await db.delete(item)
+                    else:
+                        lines[item.id_product] = item
+
+            for id_product in deltas:
+                if id_product not in requested:
+                    continue
+
+                product = products[id_product]
+                item = lines.get(id_product)
+                if item is None:
+                    item = OrderItem(id_product=id_product)
+                    order.items.append(item)
+
+                item.amount = requested[id_product]
+                item.unit_price = product.price
+
+            order.total_amount = sum(item.amount for item in order.items)
+            order.total_price = sum(item.unit_price * item.amount for item in order.items)
+            order.updated_at = func.now()
+
+        await db.commit()
         return order
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
+
+        raise
 
+    except PoolTimeoutError:
         raise
 
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -326,7 +547,7 @@ async def put_detail_order(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -334,6 +555,74 @@ async def put_detail_order(
         )
 
 
+def parse_order_ids(ids: str) -> list:
+    try:
+        order_ids = sorted({int(value) for value in ids.split(",") if value.strip()})
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="ids deve conter apenas números separados por vírgula"
+        )
+
+    if not order_ids or len(order_ids) > MAX_BATCH_DELETE:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Informe entre 1 e {MAX_BATCH_DELETE} pedidos"
+        )
+
+    return order_ids
+
+
+@order_router.delete(
+    "/",
+    response_model=OrderDeleteBatchResponse,
+    summary="Excluir pedidos em lote",
+    responses={404: {"description": "Pedido não encontrado"}}
+)
+async def delete_orders_batch(
+    ids: str = Query(..., example="1,2,3", description="IDs dos pedidos separados por vírgula"),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    check_admin_permission(current_user)
+    order_ids = parse_order_ids(ids)
+    try:
+        result = await db.execute(
+            select(Order.id_order)
+            .where(Order.id_order.in_(order_ids))
+            .order_by(Order.id_order)
+            .with_for_update()
+        )
+        missing = set(order_ids) - set(result.scalars())
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Pedidos não encontrados: {', '.join(map(str, sorted(missing)))}"
+            )
+
+        await delete_orders(db, order_ids)
+        await db.commit()
+        return OrderDeleteBatchResponse(deleted=order_ids)
+
+    except HTTPException as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise
+
+    except PoolTimeoutError:
+        raise
+
+    except SQLAlchemyError as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro inesperado no banco de dados: {e}"
+        )
+
+
 @order_router.delete(
     "/{id_order}",
     response_model=OrderResponse,
@@ -342,34 +631,35 @@ async def put_detail_order(
 )
 async def delete_detail_order(
     id_order: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user)
     try:
-        order = db.get(Order, id_order)
+        order = await db.get(
+            Order, id_order, options=[selectinload(Order.items)], with_for_update=True
+        )
         if not order:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Pedido ID {id_order} não encontrado"
             )
 
-        for item in order.items:
-            product = db.query(Product).get(item.id_product)
-            product.stock += item.amount
-        
-        db.delete(order)
-        db.commit()
+        await delete_orders(db, [id_order])
+        await db.commit()
         return order
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
+
+        raise
 
+    except PoolTimeoutError:
         raise
 
     except SQLAlchemyError as e:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -377,7 +667,7 @@ async def delete_detail_order(
         )
     
     except Exception as e:
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
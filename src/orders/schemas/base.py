@@ -0,0 +1,19 @@
+from pydantic import BaseModel, ConfigDict, model_validator
+from sqlalchemy import inspect
+
+
+class ORMResponseModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def skip_unloaded_relationships(cls, data):
+        state = inspect(data, raiseerr=False)
+        if state is None or not hasattr(state, "unloaded"):
+            return data
+
+        unloaded = state.unloaded & set(state.mapper.relationships.keys())
+        if not unloaded:
+            return data
+
+        return {name: getattr(data, name) for name in cls.model_fields if name not in unloaded}
@@ -2,7 +2,9 @@ from pydantic import BaseModel, Field, ConfigDict
 from datetime import datetime
 from typing import List, Optional
 from enum import Enum
+from .base import ORMResponseModel
 from .orderitem import OrderItemCreate, OrderItemResponse, OrderItemUpdate
+from src.clients.schemas import ClientResponse
 
 
 class OrderStatusEnum(str, Enum):
@@ -13,6 +15,11 @@ class OrderStatusEnum(str, Enum):
     FINALIZADO = "finalizado"
 
 
+class OrderView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
 class OrderBase(BaseModel):
     id_client: int = Field(..., example=1, description="ID do cliente associado")
     status: OrderStatusEnum = Field(..., example=OrderStatusEnum.PENDENTE)
@@ -36,10 +43,40 @@ class OrderUpdate(BaseModel):
     products: Optional[List[OrderItemUpdate]] = Field(None, min_length=1)
 
 
-class OrderResponse(OrderBase):
+class OrderResponse(OrderBase, ORMResponseModel):
     id_order: int = Field(..., example=1)
     total_amount: int = Field(..., example=5)
     total_price: float = Field(..., example=499.50)
     created_at: datetime = Field(..., example="2024-01-01T12:00:00Z")
-    items: List[OrderItemResponse]
+    items: Optional[List[OrderItemResponse]] = Field(None, description="Presente com include=items")
+    client: Optional[ClientResponse] = Field(None, description="Presente com include=client")
+
+
+class OrderSummaryResponse(BaseModel):
+    id_order: int = Field(..., example=1)
+    id_client: int = Field(..., example=1)
+    status: OrderStatusEnum = Field(..., example=OrderStatusEnum.PENDENTE)
+    total_amount: int = Field(..., example=5)
+    total_price: float = Field(..., example=499.50)
+    created_at: datetime = Field(..., example="2024-01-01T12:00:00Z")
     model_config = ConfigDict(from_attributes=True)
+
+
+class OrderDeleteBatchResponse(BaseModel):
+    deleted: List[int] = Field(..., example=[1, 2, 3], description="IDs dos pedidos excluídos")
+
+
+class OrderBatchCreate(BaseModel):
+    orders: List[OrderCreate] = Field(..., min_length=1, max_length=500)
+
+
+class OrderBatchResult(BaseModel):
+    index: int = Field(..., example=0, description="Posição do pedido no lote")
+    id_order: Optional[int] = Field(None, example=1, description="ID do pedido criado")
+    detail: Optional[str] = Field(None, description="Motivo da falha")
+
+
+class OrderBatchReport(BaseModel):
+    created: int = Field(..., example=498, description="Pedidos criados")
+    failed: int = Field(..., example=2, description="Pedidos rejeitados")
+    results: List[OrderBatchResult]
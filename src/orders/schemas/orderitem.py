@@ -1,4 +1,7 @@
 from pydantic import BaseModel, Field, ConfigDict
+from typing import Optional
+from src.products.schemas import ProductResponse
+from .base import ORMResponseModel
 
 
 class OrderItemBase(BaseModel):
@@ -18,7 +21,7 @@ class OrderItemUpdate(OrderItemBase):
     pass
 
 
-class OrderItemResponse(OrderItemBase):
+class OrderItemResponse(OrderItemBase, ORMResponseModel):
     id_orderitem: int = Field(..., example=1)
     unit_price: float = Field(..., example=99.90)
-    model_config = ConfigDict(from_attributes=True)
+    product: Optional[ProductResponse] = Field(None, description="Presente com include=products")
@@ -0,0 +1,80 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import List, Optional
+from pydantic import TypeAdapter, create_model
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from src.orders.models import Order, OrderItem
+from src.orders.schemas import OrderItemResponse, OrderResponse, OrderSummaryResponse
+from src.orders.schemas.base import ORMResponseModel
+from src.utils.conditional import VALIDATOR_FIELDS
+from src.utils.serialization import RowSerializer, dumps
+
+
+ORDER_RELATIONSHIPS = {"items", "client"}
+SUMMARY_FIELDS = tuple(OrderSummaryResponse.model_fields)
+
+order_rows = RowSerializer(
+    Order,
+    [name for name in OrderResponse.model_fields if name not in ORDER_RELATIONSHIPS],
+    extra=VALIDATOR_FIELDS,
+)
+item_rows = RowSerializer(
+    OrderItem,
+    [name for name in OrderItemResponse.model_fields if name != "product"],
+    extra=("id_order",),
+)
+
+
+async def load_order_items(db: AsyncSession, order_ids: list) -> dict:
+    items = defaultdict(list)
+    if not order_ids:
+        return items
+
+    rows = (await db.execute(
+        item_rows.select()
+        .where(OrderItem.id_order.in_(order_ids))
+        .order_by(OrderItem.id_orderitem)
+    )).all()
+
+    for row, item in zip(rows, item_rows.to_dicts(rows)):
+        item["product"] = None
+        items[row.id_order].append(item)
+    return items
+
+
+async def dump_order_page(db: AsyncSession, rows: list, with_items: bool) -> bytes:
+    items = await load_order_items(db, [row.id_order for row in rows]) if with_items else {}
+
+    orders = order_rows.to_dicts(rows)
+    for order in orders:
+        order["items"] = items.get(order["id_order"], []) if with_items else None
+        order["client"] = None
+    return dumps(orders)
+
+
+def sparse_load_options(fields: tuple) -> list:
+    columns = {name for name in fields if name not in ORDER_RELATIONSHIPS}
+    columns.update(("id_order", *VALIDATOR_FIELDS))
+    return [load_only(*(getattr(Order, name) for name in sorted(columns)))]
+
+
+@lru_cache(maxsize=64)
+def order_page_adapter(fields: Optional[tuple]) -> TypeAdapter:
+    if fields is None:
+        return TypeAdapter(List[OrderResponse])
+
+    if fields == SUMMARY_FIELDS:
+        return TypeAdapter(List[OrderSummaryResponse])
+
+    model = create_model(
+        "OrderSparseResponse",
+        __base__=ORMResponseModel,
+        **{name: (OrderResponse.model_fields[name].annotation, OrderResponse.model_fields[name]) for name in fields},
+    )
+    return TypeAdapter(List[model])
+
+
+def dump_orders(orders: list, fields: Optional[tuple]) -> bytes:
+    adapter = order_page_adapter(fields)
+    return adapter.dump_json(adapter.validate_python(orders, from_attributes=True))
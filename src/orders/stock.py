@@ -0,0 +1,119 @@
+from collections import Counter
+from fastapi import HTTPException, status
+from sqlalchemy import case, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+from src.orders.models import Order, OrderItem
+from src.products.models import Product
+from src.products.cache import CHANGED_PRODUCTS
+
+
+def count_amounts(items) -> Counter:
+    amounts = Counter()
+    for item in items:
+        amounts[item.id_product] += item.amount
+    return amounts
+
+
+async def select_products_for_update(db: AsyncSession, product_ids) -> dict:
+    ids = sorted(set(product_ids))
+    if not ids:
+        return {}
+
+    result = await db.execute(
+        select(Product)
+        .where(Product.id_product.in_(ids))
+        .order_by(Product.id_product)
+        .with_for_update()
+        .execution_options(populate_existing=True)
+    )
+    return {product.id_product: product for product in result.scalars()}
+
+
+async def lock_products(db: AsyncSession, product_ids) -> dict:
+    products = await select_products_for_update(db, product_ids)
+
+    for id_product in sorted(set(product_ids)):
+        if id_product not in products:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Produto ID {id_product} não encontrado"
+            )
+
+    return products
+
+
+def diff_amounts(current: Counter, requested: Counter) -> Counter:
+    deltas = Counter()
+    for id_product in current.keys() | requested.keys():
+        delta = requested[id_product] - current[id_product]
+        if delta:
+            deltas[id_product] = delta
+    return deltas
+
+
+async def apply_stock_deltas(db: AsyncSession, products: dict, amounts: Counter):
+    if not amounts:
+        return
+
+    for id_product, amount in sorted(amounts.items()):
+        product = products[id_product]
+        if product.stock < amount:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Estoque insuficiente Produto ID {id_product} (Quantidade em estoque {product.stock})"
+            )
+
+    requested = case(dict(amounts), value=Product.id_product)
+    result = await db.execute(
+        update(Product)
+        .where(Product.id_product.in_(list(amounts)), Product.stock >= requested)
+        .values(stock=Product.stock - requested)
+        .execution_options(synchronize_session=False, **{CHANGED_PRODUCTS: list(amounts)})
+    )
+
+    if result.rowcount != len(amounts):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Estoque insuficiente para concluir o pedido"
+        )
+
+    for id_product, amount in amounts.items():
+        product = products[id_product]
+        set_committed_value(product, "stock", product.stock - amount)
+
+
+async def delete_orders(db: AsyncSession, order_ids):
+    ids = sorted(set(order_ids))
+
+    product_ids = (await db.scalars(
+        select(Product.id_product)
+        .where(Product.id_product.in_(
+            select(OrderItem.id_product).where(OrderItem.id_order.in_(ids))
+        ))
+        .order_by(Product.id_product)
+        .with_for_update()
+    )).all()
+
+    restock = (
+        select(OrderItem.id_product, func.sum(OrderItem.amount).label("amount"))
+        .where(OrderItem.id_order.in_(ids))
+        .group_by(OrderItem.id_product)
+        .subquery("restock")
+    )
+    await db.execute(
+        update(Product)
+        .where(Product.id_product == restock.c.id_product)
+        .values(stock=Product.stock + restock.c.amount)
+        .execution_options(synchronize_session=False, **{CHANGED_PRODUCTS: product_ids})
+    )
+    await db.execute(
+        delete(OrderItem)
+        .where(OrderItem.id_order.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        delete(Order)
+        .where(Order.id_order.in_(ids))
+        .execution_options(synchronize_session=False)
+    )
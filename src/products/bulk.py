@@ -0,0 +1,121 @@
+import codecs
+import csv
+import json
+from itertools import islice
+from pydantic import ValidationError
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from .models import Product
+from .schemas import ProductImportRow
+
+
+BULK_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def iter_csv_rows(file):
+    reader = csv.DictReader(codecs.getreader("utf-8-sig")(file))
+    for line, row in enumerate(reader, start=2):
+        yield line, row
+
+
+def iter_ndjson_rows(file):
+    for line, raw in enumerate(codecs.getreader("utf-8")(file), start=1):
+        if not raw.strip():
+            continue
+        try:
+            yield line, json.loads(raw)
+        except json.JSONDecodeError as e:
+            yield line, e
+
+
+def iter_batches(rows, size: int):
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+
+def validate_row(row):
+    if isinstance(row, Exception):
+        return None, f"JSON inválido: {row}"
+
+    if not isinstance(row, dict):
+        return None, "Linha deve ser um objeto"
+
+    try:
+        return ProductImportRow.model_validate(row).model_dump(exclude_unset=True), None
+    except ValidationError as e:
+        return None, [
+            {"field": ".".join(str(part) for part in error["loc"]), "message": error["msg"]}
+            for error in e.errors()
+        ]
+
+
+def group_by_columns(rows: list) -> dict:
+    groups = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
+
+
+async def upsert_products(db: AsyncSession, rows: list):
+    insert = UPSERT_INSERTS[db.bind.dialect.name]
+
+    for columns, group in group_by_columns(rows).items():
+        statement = insert(Product)
+        statement = statement.on_conflict_do_update(
+            index_elements=[Product.bar_code],
+            set_={
+                **{
+                    column: statement.excluded[column]
+                    for column in columns
+                    if column != "bar_code"
+                },
+                "version": Product.version + 1,
+                "updated_at": func.now(),
+            }
+        )
+        await db.execute(statement, group)
+
+
+def report_failure(report: dict, line: int, detail):
+    report["failed"] += 1
+    if len(report["errors"]) < MAX_REPORTED_ERRORS:
+        report["errors"].append({"row": line, "detail": detail})
+
+
+async def import_products(db: AsyncSession, rows) -> dict:
+    report = {"imported": 0, "failed": 0, "errors": []}
+    batches = iter_batches(rows, BULK_BATCH_SIZE)
+
+    while True:
+        batch = await run_in_threadpool(next, batches, None)
+        if batch is None:
+            return report
+
+        valid_rows = {}
+        for line, row in batch:
+            product, error = validate_row(row)
+
+            if error:
+                report_failure(report, line, error)
+                continue
+
+            previous = valid_rows.get(product["bar_code"])
+            if previous:
+                report_failure(report, previous[0], f"bar_code repetido, substituído pela linha {line}")
+
+            valid_rows[product["bar_code"]] = (line, product)
+
+        if valid_rows:
+            await upsert_products(db, [product for _, product in valid_rows.values()])
+            await db.commit()
+            report["imported"] += len(valid_rows)
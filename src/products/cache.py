@@ -0,0 +1,197 @@
+import asyncio
+import logging
+from datetime import datetime
+from threading import Lock
+from typing import NamedTuple, Optional
+import asyncpg
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, object_session
+from src.common.cache import TTLCache
+from src.common.config import settings
+from .models import Product
+
+
+logger = logging.getLogger(__name__)
+
+
+PRODUCT_CACHE_CHANNEL = "product_cache"
+ALL_PRODUCTS = "*"
+MAX_NOTIFY_PAYLOAD = 7000
+CHANGED_PRODUCTS = "changed_products"
+RECONNECT_MIN_DELAY = 0.5
+RECONNECT_MAX_DELAY = 30.0
+
+
+class CachedPage(NamedTuple):
+    body: bytes
+    etag: str
+    last_modified: Optional[datetime]
+    next_cursor: Optional[str]
+
+
+class ProductCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.details = TTLCache(maxsize, ttl)
+        self.lists = TTLCache(maxsize, ttl)
+        self.generation = 0
+        self._lock = Lock()
+
+    def get_detail(self, id_product: int):
+        return self.details.get(id_product)
+
+    def set_detail(self, id_product: int, product, generation: int):
+        with self._lock:
+            if generation == self.generation:
+                self.details.set(id_product, product)
+
+    def get_list(self, key: tuple):
+        return self.lists.get(key)
+
+    def set_list(self, key: tuple, page, generation: int):
+        with self._lock:
+            if generation == self.generation:
+                self.lists.set(key, page)
+
+    def invalidate(self, product_ids=None):
+        with self._lock:
+            self.generation += 1
+            self.lists.clear()
+            if product_ids is None:
+                self.details.clear()
+            else:
+                for id_product in product_ids:
+                    self.details.invalidate(id_product)
+
+    def stats(self) -> dict:
+        return {"details": self.details.stats(), "lists": self.lists.stats()}
+
+
+product_cache = ProductCache(
+    maxsize=settings.PRODUCT_CACHE_SIZE,
+    ttl=settings.PRODUCT_CACHE_TTL,
+)
+
+
+def mark_changed(session: Session, product_ids=None):
+    if product_ids is None:
+        session.info[CHANGED_PRODUCTS] = ALL_PRODUCTS
+        return
+
+    pending = session.info.setdefault(CHANGED_PRODUCTS, set())
+    if pending != ALL_PRODUCTS:
+        pending.update(product_ids)
+
+
+def encode_payload(pending) -> str:
+    if pending == ALL_PRODUCTS:
+        return ALL_PRODUCTS
+
+    payload = ",".join(str(id_product) for id_product in sorted(pending))
+    return payload if len(payload) <= MAX_NOTIFY_PAYLOAD else ALL_PRODUCTS
+
+
+def decode_payload(payload: str):
+    if payload == ALL_PRODUCTS:
+        return None
+    return {int(value) for value in payload.split(",") if value}
+
+
+@event.listens_for(Product, "after_insert")
+@event.listens_for(Product, "after_update")
+@event.listens_for(Product, "after_delete")
+def track_product_change(mapper, connection, target):
+    session = object_session(target)
+    if session is not None:
+        mark_changed(session, [target.id_product])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def track_bulk_product_change(orm_execute_state):
+    if orm_execute_state.is_select:
+        return
+
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or mapper.class_ is not Product:
+        return
+
+    mark_changed(
+        orm_execute_state.session,
+        orm_execute_state.execution_options.get(CHANGED_PRODUCTS),
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def notify_product_changes(session):
+    session.flush()
+    pending = session.info.get(CHANGED_PRODUCTS)
+    if pending and session.get_bind().dialect.name == "postgresql":
+        session.execute(select(func.pg_notify(PRODUCT_CACHE_CHANNEL, encode_payload(pending))))
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_changes(session):
+    pending = session.info.pop(CHANGED_PRODUCTS, None)
+    if pending:
+        product_cache.invalidate(None if pending == ALL_PRODUCTS else pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_rolled_back_changes(session):
+    session.info.pop(CHANGED_PRODUCTS, None)
+
+
+def on_notification(connection, pid, channel, payload):
+    product_cache.invalidate(decode_payload(payload))
+
+
+class InvalidationListener:
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self.connection = None
+        self.reconnecting = None
+        self.closed = False
+
+    async def connect(self):
+        connection = await asyncpg.connect(self.dsn)
+        await connection.add_listener(PRODUCT_CACHE_CHANNEL, on_notification)
+        connection.add_termination_listener(self.on_termination)
+        self.connection = connection
+        product_cache.invalidate()
+
+    def on_termination(self, connection):
+        if self.closed or connection is not self.connection:
+            return
+
+        logger.warning("Conexão LISTEN do cache de produtos encerrada, reconectando")
+        self.connection = None
+        product_cache.invalidate()
+        self.reconnecting = asyncio.ensure_future(self.reconnect())
+
+    async def reconnect(self):
+        delay = RECONNECT_MIN_DELAY
+        while not self.closed:
+            try:
+                await self.connect()
+                return
+            except Exception as e:
+                logger.warning("Falha ao reconectar LISTEN do cache de produtos: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RECONNECT_MAX_DELAY)
+
+    async def close(self):
+        self.closed = True
+        if self.reconnecting is not None:
+            self.reconnecting.cancel()
+        if self.connection is not None:
+            await self.connection.close()
+
+
+async def start_invalidation_listener():
+    url = make_url(settings.DATABASE_URL)
+    if url.get_backend_name() != "postgresql":
+        return None
+
+    listener = InvalidationListener(url.set(drivername="postgresql").render_as_string(hide_password=False))
+    await listener.connect()
+    return listener
@@ -1,21 +1,29 @@
-from sqlalchemy import Column, Integer, String, Float, Text, DateTime
+from sqlalchemy import Column, Integer, String, Float, Text, DateTime, Index
 from sqlalchemy.orm import relationship
-from src.common.database import Base
+from src.common.database import Base, VersionMixin
 
 
-class Product(Base):
+class Product(VersionMixin, Base):
     __tablename__ = "product"
+    __table_args__ = tuple(
+        Index(
+            f"ix_product_{column}_trgm", column,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"}
+        )
+        for column in ("name", "description", "category", "bar_code")
+    )
 
     id_product = Column(Integer, primary_key=True, index=True, autoincrement=True)
     
     name = Column(String(100), nullable=False)
     bar_code = Column(String(50), unique=True, nullable=False)
     description = Column(Text, nullable=True)
-    price = Column(Float, nullable=False)
-    stock = Column(Integer, nullable=False)
+    price = Column(Float, nullable=False, index=True)
+    stock = Column(Integer, nullable=False, index=True)
     valid_date = Column(DateTime, nullable=True)
     images = Column(Text, nullable=True)
-    category = Column(String(50), nullable=True)
+    category = Column(String(50), nullable=True, index=True)
     section = Column(String(50), nullable=True)
 
-    order_items = relationship("OrderItem", back_populates="product")
+    order_items = relationship("OrderItem", back_populates="product", lazy="raise", passive_deletes=True)
@@ -1,15 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, status, Query, Request, Response
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError, TimeoutError as PoolTimeoutError
 from typing import Optional, Annotated, List, Union
 from datetime import datetime
 from pathlib import Path
 from src.auth.security.token import get_current_user
 from src.common.database import get_db
 from src.utils.role_validator import check_admin_permission
+from src.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, next_cursor, paginate
 from .models import Product
-from .schemas import ProductCreate, ProductResponse
-from sentry_sdk import capture_exception
+from src.orders.models import OrderItem
+from .schemas import ProductCreate, ProductResponse, ProductImportReport
+from .search import build_search_query
+from .cache import CachedPage, product_cache
+from pydantic import TypeAdapter
+from src.common.config import settings
+from src.utils.singleflight import SingleFlight
+from src.utils.serialization import RowSerializer, json_response
+from src.utils.conditional import (
+    VALIDATOR_FIELDS,
+    cache_headers,
+    detail_not_modified,
+    detail_validators,
+    is_not_modified,
+    not_modified,
+    page_not_modified,
+    page_validators,
+    set_cache_headers,
+)
+from .bulk import import_products, iter_csv_rows, iter_ndjson_rows
+from src.utils.exceptions import capture_exception
 import uuid
 import shutil
 
@@ -27,6 +48,7 @@ product_router = APIRouter(
 UPLOAD_DIR = Path("media")
 UPLOAD_DIR.mkdir(exist_ok=True)
 ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png"]
+NDJSON_CONTENT_TYPES = ["application/x-ndjson", "application/jsonl", "application/json-seq"]
 
 
 @product_router.post(
@@ -56,7 +78,7 @@ async def post_product(
     category: Optional[str] = Form(None),
     section: Optional[str] = Form(None),
     image: Optional[Union[UploadFile, str]] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     check_admin_permission(current_user)
     
@@ -103,28 +125,31 @@ async def post_product(
         product = Product(**product_data.model_dump(exclude_none=True))
         
         db.add(product)
-        db.commit()
-        db.refresh(product)
+        await db.commit()
+        await db.refresh(product)
         return product
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise
 
     except IntegrityError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Dados únicos já existentes: {e}"
         )
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -133,11 +158,85 @@ async def post_product(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(status_code=500, detail=f"Erro ao criar produto: {e}")
 
 
+@product_router.post(
+    "/bulk",
+    response_model=ProductImportReport,
+    summary="Importar produtos em lote (CSV ou NDJSON)",
+    responses={
+        200: {"description": "Relatório da importação por linha"},
+        403: {"description": "Acesso negado"},
+        500: {"description": "Erro interno no servidor"}
+    }
+)
+async def post_products_bulk(
+    file: UploadFile = File(..., description="Arquivo CSV com cabeçalho ou NDJSON, um produto por linha"),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="Formato do arquivo; inferido pela extensão quando omitido"),
+    current_user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    check_admin_permission(current_user)
+
+    if format is None:
+        is_ndjson = (
+            (file.filename or "").endswith((".ndjson", ".jsonl"))
+            or file.content_type in NDJSON_CONTENT_TYPES
+        )
+        format = "ndjson" if is_ndjson else "csv"
+
+    rows = iter_ndjson_rows(file.file) if format == "ndjson" else iter_csv_rows(file.file)
+
+    try:
+        return await import_products(db, rows)
+
+    except PoolTimeoutError:
+        raise
+
+    except SQLAlchemyError as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro inesperado no banco de dados: {e}"
+        )
+
+    except Exception as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise HTTPException(status_code=500, detail=f"Erro ao importar produtos: {e}")
+
+
+product_flights = SingleFlight(timeout=settings.COALESCE_TIMEOUT)
+product_page_adapter = TypeAdapter(List[ProductResponse])
+product_rows = RowSerializer(Product, ProductResponse.model_fields, extra=VALIDATOR_FIELDS)
+
+
+async def load_product_page(db: AsyncSession, page_query, cache_key: tuple, limit: int) -> CachedPage:
+    generation = product_cache.generation
+    if settings.FAST_JSON_RESPONSES:
+        rows = (await db.execute(page_query)).all()
+        body = product_rows.dump(rows)
+    else:
+        rows = (await db.execute(page_query)).scalars().all()
+        body = product_page_adapter.dump_json(product_page_adapter.validate_python(rows, from_attributes=True))
+
+    etag, last_modified = page_validators(cache_key, rows, "id_product")
+    page = CachedPage(
+        body=body,
+        etag=etag,
+        last_modified=last_modified,
+        next_cursor=next_cursor(rows, "id_product", limit),
+    )
+    product_cache.set_list(cache_key, page, generation)
+    return page
+
+
 @product_router.get(
     "/",
     response_model=List[ProductResponse],
@@ -148,31 +247,58 @@ async def post_product(
     }
 )
 async def get_products(
+    request: Request,
     category: Optional[str] = Query(None, example="eletrônicos", description="Filtrar por categoria"),
     price: Optional[float] = Query(None, example=99.90, description="Filtrar por preço exato"),
     available: Optional[bool] = Query(None, example=True, description="Filtrar por disponibilidade em estoque"),
     skip: int = Query(0, ge=0, example=0),
     limit: int = Query(10, ge=1, le=100, example=10),
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em X-Next-Cursor"),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    after = decode_cursor(cursor)
+    cache_key = (category, price, available, skip, limit, after)
+
     try:
-        query = db.query(Product)
+        page = product_cache.get_list(cache_key)
+        if page is None:
+            query = product_rows.select() if settings.FAST_JSON_RESPONSES else select(Product)
+
+            if category:
+                query = query.where(Product.category.ilike(f"%{category}%"))
+
+            if price is not None:
+                query = query.where(Product.price == price)
 
-        if category:
-            query = query.filter(Product.category.ilike(f"%{category}%"))
+            if available is not None:
+                query = query.where(Product.stock > 0 if available else Product.stock == 0)
 
-        if price is not None:
-            query = query.filter(Product.price == price)
+            page_query = paginate(query, Product.id_product, skip, limit, after)
+            unchanged = await page_not_modified(db, request, page_query, cache_key, "id_product")
+            if unchanged is not None:
+                return unchanged
+
+            page = await product_flights.run(
+                ("/products/", cache_key, current_user["role"]),
+                lambda: load_product_page(db, page_query, cache_key, limit),
+                route="/products/",
+            )
 
-        if available is not None:
-            query = query.filter(Product.stock > 0 if available else Product.stock == 0)
+        if is_not_modified(request, page.etag, page.last_modified):
+            return not_modified(page.etag, page.last_modified)
 
-        return query.offset(skip).limit(limit).all()
+        headers = cache_headers(page.etag, page.last_modified)
+        if page.next_cursor is not None:
+            headers[NEXT_CURSOR_HEADER] = page.next_cursor
+        return json_response(page.body, headers)
+
+    except PoolTimeoutError:
+        raise
 
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -181,11 +307,55 @@ async def get_products(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(status_code=500, detail=f"Erro ao buscar produto: {e}")
     
 
+@product_router.get(
+    "/search",
+    response_model=List[ProductResponse],
+    summary="Buscar produtos por nome, descrição, categoria ou código de barras",
+    responses={
+        200: {"description": "Produtos ordenados por relevância"},
+        500: {"description": "Erro interno no servidor"}
+    }
+)
+async def search_products(
+    q: str = Query(..., min_length=2, max_length=100, example="camiseta", description="Termo de busca"),
+    skip: int = Query(0, ge=0, example=0),
+    limit: int = Query(10, ge=1, le=100, example=10),
+    db: AsyncSession = Depends(get_db),
+    current_user: dict = Depends(get_current_user)
+):
+    try:
+        query = build_search_query(db.bind.dialect.name, q.strip()).offset(skip).limit(limit)
+        if settings.FAST_JSON_RESPONSES:
+            rows = (await db.execute(query.with_only_columns(*product_rows.columns))).all()
+            return json_response(product_rows.dump(rows))
+
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    except PoolTimeoutError:
+        raise
+
+    except SQLAlchemyError as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Erro ao buscar produtos: {e}"
+        )
+
+    except Exception as e:
+        capture_exception(e)
+        await db.rollback()
+
+        raise HTTPException(status_code=500, detail=f"Erro ao buscar produtos: {e}")
+
+
 @product_router.get(
     "/{id_product}",
     response_model=ProductResponse,
@@ -196,28 +366,53 @@ async def get_products(
     }
 )
 async def get_detail_product(
+    request: Request,
+    response: Response,
     id_product: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
+    cached = product_cache.get_detail(id_product)
+    if cached is not None:
+        product, etag, last_modified = cached
+        if is_not_modified(request, etag, last_modified):
+            return not_modified(etag, last_modified)
+
+        set_cache_headers(response, etag, last_modified)
+        return product
+
     try:
-        product = db.query(Product).get(id_product)
+        generation = product_cache.generation
+        unchanged = await detail_not_modified(db, request, Product, Product.id_product, id_product)
+        if unchanged is not None:
+            return unchanged
+
+        product = await db.get(Product, id_product)
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Produto ID {id_product} não encontrado"
             )
+
+        etag, last_modified = detail_validators(Product, id_product, product.version, product.updated_at)
+        product = ProductResponse.model_validate(product)
+        product_cache.set_detail(id_product, (product, etag, last_modified), generation)
+
+        set_cache_headers(response, etag, last_modified)
         return product
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
+
+        raise
 
+    except PoolTimeoutError:
         raise
 
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -226,7 +421,7 @@ async def get_detail_product(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(status_code=500, detail=f"Erro ao buscar produtos: {e}")
 
@@ -262,12 +457,12 @@ async def put_detail_product(
     category: Optional[str] = Form(None),
     section: Optional[str] = Form(None),
     image: Optional[Union[UploadFile, str]] = File(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     check_admin_permission(current_user)
 
     try:
-        product = db.get(Product, id_product)
+        product = await db.get(Product, id_product)
 
         if not product:
             raise HTTPException(
@@ -316,28 +511,31 @@ async def put_detail_product(
             if value is not None:
                 setattr(product, key, value)
 
-        db.commit()
-        db.refresh(product)
+        await db.commit()
+        await db.refresh(product)
         return product
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise
 
     except IntegrityError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Dados únicos já existentes: {e}"
         )
 
+    except PoolTimeoutError:
+        raise
+
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -346,7 +544,7 @@ async def put_detail_product(
 
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(status_code=500, detail=f"Erro ao atualizar produto: {e}")
 
@@ -364,38 +562,41 @@ async def put_detail_product(
 )
 async def delete_detail_product(
     id_product: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     current_user: dict = Depends(get_current_user)
 ):
     check_admin_permission(current_user)
     
     try:
-        product = db.query(Product).get(id_product)
+        product = await db.get(Product, id_product)
         if not product:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Produto ID {id_product} não encontrado"
             )
         
-        if product.order_items:
+        if await db.scalar(select(exists().where(OrderItem.id_product == id_product))):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Não é possível excluir um produto associado a uma order."
             )
 
-        db.delete(product)
-        db.commit()
+        await db.delete(product)
+        await db.commit()
         return product
     
     except HTTPException as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
+
+        raise
 
+    except PoolTimeoutError:
         raise
 
     except SQLAlchemyError as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -404,7 +605,7 @@ async def delete_detail_product(
     
     except Exception as e:
         capture_exception(e)
-        db.rollback()
+        await db.rollback()
 
         raise HTTPException(
             status_code=500, 
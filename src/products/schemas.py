@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional
+from typing import Optional, List, Union
 from datetime import datetime
 from pydantic import ConfigDict
 
@@ -36,6 +36,21 @@ class ProductCreate(ProductBase):
     pass
 
 
+class ProductImportRow(ProductCreate, EmptyStrToNoneMixin):
+    pass
+
+
+class ProductImportError(BaseModel):
+    row: int = Field(..., example=3, description="Linha do arquivo com erro")
+    detail: Union[str, List[dict]] = Field(..., description="Erros de validação da linha")
+
+
+class ProductImportReport(BaseModel):
+    imported: int = Field(..., example=998, description="Produtos inseridos ou atualizados")
+    failed: int = Field(..., example=2, description="Linhas rejeitadas")
+    errors: List[ProductImportError] = Field(default_factory=list)
+
+
 class ProductUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     bar_code: Optional[str] = Field(None, min_length=1, max_length=50)
@@ -0,0 +1,29 @@
+from sqlalchemy import case, func, literal, or_, select
+from .models import Product
+
+
+SEARCH_COLUMNS = (Product.name, Product.description, Product.category, Product.bar_code)
+
+
+def escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def build_search_query(dialect_name: str, term: str):
+    pattern = f"%{escape_like(term)}%"
+    matches = or_(*(column.ilike(pattern, escape="\\") for column in SEARCH_COLUMNS))
+
+    if dialect_name == "postgresql":
+        rank = func.greatest(*(
+            func.similarity(func.coalesce(column, ""), term) for column in SEARCH_COLUMNS
+        ))
+        matches = or_(matches, Product.name.op("%")(term))
+    else:
+        rank = case(
+            (Product.bar_code == term, literal(3)),
+            (Product.name.ilike(f"{escape_like(term)}%", escape="\\"), literal(2)),
+            (Product.name.ilike(pattern, escape="\\"), literal(1)),
+            else_=literal(0)
+        )
+
+    return select(Product).where(matches).order_by(rank.desc(), Product.id_product)
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from hashlib import sha1
+from typing import Optional
+from fastapi import Request, Response, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+VALIDATOR_FIELDS = ("version", "updated_at")
+
+def strong_etag(name: str, key: int, version: int) -> str:
+    return f'"{name}-{key}-{version}"'
+
+
+def weak_etag(filters: tuple, versions: tuple, last_modified) -> str:
+    state = (filters, versions, last_modified)
+    return f'W/"{sha1(repr(state).encode()).hexdigest()[:20]}"'
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def cache_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def not_modified(etag: str, last_modified: Optional[datetime]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, last_modified))
+
+
+def detail_validators(model, key: int, version: int, last_modified) -> tuple:
+    return strong_etag(model.__tablename__, key, version), last_modified
+
+
+def page_validators(filters: tuple, rows, key: str) -> tuple:
+    last_modified = max((row.updated_at for row in rows), default=None)
+    etag = weak_etag(filters, tuple((getattr(row, key), row.version) for row in rows), last_modified)
+    return etag, last_modified
+
+
+async def detail_not_modified(
+    db: AsyncSession, request: Request, model, key_column, key: int
+) -> Optional[Response]:
+    if not is_conditional(request):
+        return None
+
+    row = (await db.execute(
+        select(model.version, model.updated_at).where(key_column == key)
+    )).first()
+    if row is None:
+        return None
+
+    etag, last_modified = detail_validators(model, key, row.version, row.updated_at)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    return None
+
+
+async def page_not_modified(
+    db: AsyncSession, request: Request, page_query, filters: tuple, key: str
+) -> Optional[Response]:
+    if not is_conditional(request):
+        return None
+
+    page = page_query.subquery()
+    rows = (await db.execute(
+        select(page.c[key], page.c.version, page.c.updated_at).order_by(page.c[key])
+    )).all()
+
+    etag, last_modified = page_validators(filters, rows, key)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified(etag, last_modified)
+    return None
+
+
+def set_cache_headers(response: Response, etag: str, last_modified: Optional[datetime]):
+    response.headers.update(cache_headers(etag, last_modified))
@@ -1,8 +1,24 @@
 from fastapi import Request
-from fastapi.exceptions import HTTPException, RequestValidationError
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.encoders import jsonable_encoder
-from sentry_sdk import capture_exception
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from starlette.exceptions import HTTPException
+import sentry_sdk
+
+
+def is_expected_error(exc) -> bool:
+    if isinstance(exc, RequestValidationError):
+        return True
+
+    return isinstance(exc, HTTPException) and exc.status_code < 500
+
+
+def capture_exception(exc):
+    if is_expected_error(exc):
+        return None
+
+    return sentry_sdk.capture_exception(exc)
 
 
 def register_exception_handlers(app):
@@ -15,25 +31,43 @@ def register_exception_handlers(app):
             content=jsonable_encoder({"detail": exc.errors()}),
         )
 
+    @app.exception_handler(PoolTimeoutError)
+    async def pool_timeout_exception_handler(request: Request, exc: PoolTimeoutError):
+        return JSONResponse(
+            status_code=503,
+            content={"detail": "Banco de dados sobrecarregado, tente novamente"},
+            headers={"Retry-After": "1"},
+        )
 
-def sentry_exception_middleware(app):
-    @app.middleware("http")
-    async def sentry_exception_middleware(request: Request, call_next):
-        try:
-            response = await call_next(request)
 
-            return response
-        
-        except HTTPException as http_exc:
-            capture_exception(http_exc)
+class SentryExceptionMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
 
-            raise http_exc
-        
         except Exception as exc:
             capture_exception(exc)
 
-            return JSONResponse(
+            if response_started:
+                raise
+
+            response = JSONResponse(
                 status_code=500,
                 content={"detail": f"Erro interno do servidor: {exc}"},
             )
-        
\ No newline at end of file
+            await response(scope, receive, send)
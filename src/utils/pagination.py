@@ -0,0 +1,51 @@
+import base64
+import binascii
+import json
+from fastapi import HTTPException, Response, status
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(value: int) -> str:
+    raw = json.dumps({"after": value}).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if not cursor:
+        return None
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value = json.loads(base64.urlsafe_b64decode(padded))["after"]
+        if not isinstance(value, int):
+            raise ValueError(value)
+        return value
+
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor de paginação inválido"
+        )
+
+
+def paginate(query, key_column, skip: int, limit: int, after: int | None):
+    query = query.order_by(key_column)
+
+    if after is not None:
+        return query.where(key_column > after).limit(limit)
+
+    return query.offset(skip).limit(limit)
+
+
+def next_cursor(rows: list, key: str, limit: int) -> str | None:
+    if len(rows) == limit:
+        return encode_cursor(getattr(rows[-1], key))
+    return None
+
+
+def set_next_cursor(response: Response, rows: list, key: str, limit: int):
+    cursor = next_cursor(rows, key, limit)
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,40 @@
+import json
+from datetime import date
+from fastapi import Response
+from sqlalchemy import select
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def json_default(value):
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def dumps(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, default=json_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_response(content: bytes, headers=None) -> Response:
+    return Response(content=content, media_type="application/json", headers=dict(headers or {}))
+
+
+class RowSerializer:
+    def __init__(self, model, fields, extra=()):
+        self.fields = tuple(fields)
+        self.columns = [getattr(model, name) for name in (*self.fields, *extra)]
+
+    def select(self):
+        return select(*self.columns)
+
+    def to_dicts(self, rows) -> list:
+        return [dict(zip(self.fields, row)) for row in rows]
+
+    def dump(self, rows) -> bytes:
+        return dumps(self.to_dicts(rows))
@@ -0,0 +1,44 @@
+import asyncio
+from src.common.metrics import COALESCED_REQUESTS, COALESCE_TIMEOUTS
+
+
+class SingleFlight:
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self._flights = {}
+
+    async def run(self, key, func, route: str):
+        flight = self._flights.get(key)
+        if flight is None:
+            return await self._lead(key, func)
+
+        COALESCED_REQUESTS.labels(route).inc()
+        try:
+            return await asyncio.wait_for(asyncio.shield(flight), self.timeout)
+        except asyncio.TimeoutError:
+            COALESCE_TIMEOUTS.labels(route).inc()
+        except asyncio.CancelledError:
+            if not flight.cancelled():
+                raise
+
+        return await func()
+
+    async def _lead(self, key, func):
+        flight = asyncio.get_running_loop().create_future()
+        flight.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._flights[key] = flight
+
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
@@ -1,8 +1,11 @@
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
-from src.common.database import Base, get_db
+from sqlalchemy.pool import NullPool
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.common.database import Base, get_db, get_async_database_url
 from src.main import app
 from src.auth.security.token import get_current_user
 
@@ -13,6 +16,13 @@ engine = create_engine(
 )
 TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool
+)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_database():
@@ -31,6 +41,46 @@ def db_session():
         db.close()
 
 
+@pytest.fixture(scope="function")
+def count_queries():
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    yield statements
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture(scope="function")
+def max_queries(count_queries):
+    @contextmanager
+    def _max_queries(limit):
+        count_queries.clear()
+        yield count_queries
+        statements = "\n".join(statement for statement, _ in count_queries)
+        assert len(count_queries) <= limit, (
+            f"{len(count_queries)} consultas executadas, limite {limit}:\n{statements}"
+        )
+
+    return _max_queries
+
+
+@pytest.fixture(scope="function")
+def explain_plan():
+    def _explain(statement, parameters=()):
+        with engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                connection.exec_driver_sql("SET enable_seqscan = off")
+                rows = connection.exec_driver_sql(f"EXPLAIN {statement}", parameters).all()
+            else:
+                rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        return "\n".join(str(row[-1]) for row in rows)
+
+    return _explain
+
+
 def regular_user():
     return {"username": "regular", "role": "regular"}
 
@@ -41,11 +91,9 @@ def admin_user():
 
 @pytest.fixture(scope="function")
 def client(db_session):
-    def _override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def _override_get_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
 
     app.dependency_overrides[get_db] = _override_get_db
     app.dependency_overrides[get_current_user] = regular_user
@@ -56,11 +104,9 @@ def client(db_session):
 
 @pytest.fixture
 def client_with_admin(db_session):
-    def _override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def _override_get_db():
+        async with TestingAsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = _override_get_db
     app.dependency_overrides[get_current_user] = admin_user
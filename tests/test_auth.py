@@ -1,7 +1,14 @@
+import asyncio
+import threading
 import pytest
 from http import HTTPStatus
+from fastapi import HTTPException
+from passlib.context import CryptContext
 from src.auth.models import User
-from src.auth.security.token import get_password_hash
+from src.auth.security.token import get_password_hash, get_current_user
+from src.auth.security.principal_cache import PrincipalCache, principal_cache
+from src.auth.security.password_pool import PasswordHashPool
+from src.main import app
 
 
 def create_mock_user(db_session):
@@ -95,3 +102,106 @@ def test_refresh_token_invalid(client):
 
     assert response.status_code == HTTPStatus.UNAUTHORIZED
     assert response.json()["detail"] == "Refresh token inválido ou expirado."
+
+
+def test_principal_cache_evicts_least_recently_used():
+    cache = PrincipalCache(maxsize=2, ttl=60)
+    cache.set("a", {"username": "a"})
+    cache.set("b", {"username": "b"})
+    cache.get("a")
+    cache.set("c", {"username": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"username": "a"}
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_principal_cache_expires_entries():
+    cache = PrincipalCache(maxsize=2, ttl=-1)
+    cache.set("a", {"username": "a"})
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_current_user_is_cached_and_invalidated_on_role_change(client, db_session):
+    create_mock_user(db_session)
+    principal_cache.clear()
+
+    login_response = client.post("/auth/login", data={
+        "username": "test_user",
+        "password": "test_password"
+    })
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    app.dependency_overrides.pop(get_current_user)
+
+    hits = principal_cache.hits
+    assert client.get("/clients/", headers=headers).status_code == HTTPStatus.OK
+    assert client.get("/clients/", headers=headers).status_code == HTTPStatus.OK
+    assert principal_cache.hits == hits + 1
+    assert principal_cache.get("test_user")["role"] == "regular"
+
+    user = db_session.query(User).filter(User.username == "test_user").first()
+    user.role = "admin"
+    db_session.commit()
+
+    assert principal_cache.get("test_user") is None
+
+
+def test_principal_cache_invalidated_only_after_commit(db_session):
+    create_mock_user(db_session)
+    principal = {"username": "test_user", "role": "regular", "id_user": 1}
+    principal_cache.set("test_user", principal)
+
+    user = db_session.query(User).filter(User.username == "test_user").first()
+    user.role = "admin"
+    db_session.flush()
+    assert principal_cache.get("test_user") == principal
+
+    db_session.rollback()
+    assert principal_cache.get("test_user") == principal
+
+    user = db_session.query(User).filter(User.username == "test_user").first()
+    db_session.delete(user)
+    db_session.flush()
+    assert principal_cache.get("test_user") == principal
+
+    db_session.commit()
+    assert principal_cache.get("test_user") is None
+
+
+def test_login_upgrades_hash_when_cost_changes(client, db_session):
+    db_session.query(User).delete()
+    db_session.commit()
+    weak_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4)
+    db_session.add(User(username="legacy_user", password=weak_context.hash("legacy_pass"), role="regular"))
+    db_session.commit()
+
+    response = client.post("/auth/login", data={
+        "username": "legacy_user",
+        "password": "legacy_pass"
+    })
+    assert response.status_code == HTTPStatus.OK
+
+    db_session.expire_all()
+    user = db_session.query(User).filter(User.username == "legacy_user").first()
+    assert not user.password.startswith("$2b$04$")
+
+
+def test_password_pool_rejects_when_saturated():
+    pool = PasswordHashPool(max_workers=1, max_pending=0)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await pool.run(lambda: None)
+
+        release.set()
+        await running
+        return exc_info.value.status_code
+
+    assert asyncio.run(scenario()) == HTTPStatus.SERVICE_UNAVAILABLE
@@ -77,4 +77,40 @@ def test_delete_client_success(client_with_admin, db_session):
     response = client_with_admin.delete(f"/clients/{mock_client.id_client}")
     assert response.status_code == HTTPStatus.OK
     assert response.json()["id_client"] == mock_client.id_client
-    
\ No newline at end of file
+    
+
+def test_client_conditional_get(client_with_admin, db_session):
+    client = create_mock_client(db_session)
+
+    response = client_with_admin.get(f"/clients/{client.id_client}")
+    etag = response.headers["ETag"]
+    last_modified = response.headers["Last-Modified"]
+
+    response = client_with_admin.get(f"/clients/{client.id_client}", headers={"If-None-Match": f'"other", {etag}'})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    response = client_with_admin.get(f"/clients/{client.id_client}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    listing = client_with_admin.get("/clients/")
+    response = client_with_admin.get("/clients/", headers={"If-None-Match": listing.headers["ETag"]})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    client_with_admin.put(f"/clients/{client.id_client}", json={"phone": "(11) 98888-7777"})
+
+    response = client_with_admin.get(f"/clients/{client.id_client}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+
+def test_fast_json_client_listing_matches_schema(client, db_session, monkeypatch):
+    from src.common.config import settings
+    create_mock_client(db_session)
+
+    expected = client.get("/clients/?limit=1")
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    response = client.get("/clients/?limit=1")
+
+    assert response.json() == expected.json()
+    assert response.headers["ETag"] == expected.headers["ETag"]
+    assert response.headers["X-Next-Cursor"] == expected.headers["X-Next-Cursor"]
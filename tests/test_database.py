@@ -0,0 +1,52 @@
+import asyncio
+from http import HTTPStatus
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from src.common import database
+
+
+def test_pool_timeout_returns_503(client, monkeypatch):
+    from src.main import app
+    small_engine = create_async_engine(
+        "sqlite+aiosqlite:///./test.db", poolclass=database.InstrumentedQueuePool,
+        pool_size=1, max_overflow=0, pool_timeout=0.1,
+    )
+    SmallSession = async_sessionmaker(bind=small_engine)
+
+    async def small_get_db():
+        async with SmallSession() as db:
+            yield db
+
+    app.dependency_overrides[database.get_db] = small_get_db
+    holder = client.portal.call(small_engine.connect)
+    timeouts = database.pool_stats.timeouts
+    try:
+        response = client.get("/clients/")
+    finally:
+        client.portal.call(holder.close)
+        client.portal.call(small_engine.dispose)
+
+    assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert database.pool_stats.timeouts == timeouts + 1
+
+
+def test_get_db_does_not_check_out_a_connection():
+    async def scenario():
+        checkouts = database.pool_stats.checkouts
+        session_factory = database.get_db()
+        db = await anext(session_factory)
+        in_transaction = db.in_transaction()
+        await session_factory.aclose()
+        return in_transaction, database.pool_stats.checkouts - checkouts
+
+    assert asyncio.run(scenario()) == (False, 0)
+
+
+def test_create_db_engine_returns_warmup_connections():
+    async def scenario():
+        await database.create_db_engine()
+        checked_out = database.engine.pool.checkedout()
+        await database.engine.dispose()
+        return checked_out
+
+    assert asyncio.run(scenario()) == 0
@@ -0,0 +1,58 @@
+from http import HTTPStatus
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+from fastapi import HTTPException
+from src.common.config import before_send, settings, traces_sampler
+from src.utils.exceptions import SentryExceptionMiddleware, is_expected_error
+
+
+def create_app():
+    app = FastAPI()
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("falhou")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for index in range(3):
+                yield f"{index}\n"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app.add_middleware(SentryExceptionMiddleware)
+    return app
+
+
+def test_unhandled_exception_returns_500():
+    with TestClient(create_app(), raise_server_exceptions=False) as client:
+        response = client.get("/boom")
+
+    assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+    assert response.json()["detail"] == "Erro interno do servidor: falhou"
+
+
+def test_streaming_response_passes_through():
+    with TestClient(create_app()) as client:
+        response = client.get("/stream")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == "0\n1\n2\n"
+
+
+def test_expected_errors_are_not_reported():
+    assert is_expected_error(HTTPException(status_code=404))
+    assert not is_expected_error(HTTPException(status_code=503))
+    assert not is_expected_error(RuntimeError())
+
+    not_found = HTTPException(status_code=404)
+    assert before_send({}, {"exc_info": (type(not_found), not_found, None)}) is None
+    assert before_send({"id": 1}, {}) == {"id": 1}
+
+
+def test_traces_sampler_skips_docs_and_honours_parent():
+    assert traces_sampler({"asgi_scope": {"path": "/docs"}}) == 0.0
+    assert traces_sampler({"asgi_scope": {"path": "/orders/"}, "parent_sampled": True}) == 1.0
+    assert traces_sampler({"asgi_scope": {"path": "/orders/"}}) == settings.SENTRY_TRACES_SAMPLE_RATE
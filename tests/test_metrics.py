@@ -0,0 +1,71 @@
+from http import HTTPStatus
+from prometheus_client import REGISTRY
+
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test_metrics_records_route_status_and_queries(client):
+    from src.products.cache import product_cache
+
+    product_cache.invalidate()
+    requests_before = sample("http_requests_total", method="GET", route="/products/", status="200")
+    queries_before = sample("http_request_db_queries_sum", route="/products/")
+
+    response = client.get("/products/")
+    assert response.status_code == HTTPStatus.OK
+
+    assert sample("http_requests_total", method="GET", route="/products/", status="200") == requests_before + 1
+    assert sample("http_request_db_queries_sum", route="/products/") > queries_before
+    assert sample("http_request_duration_seconds_count", method="GET", route="/products/") >= 1
+    assert sample("http_requests_in_progress", method="GET") == 0
+
+
+def test_metrics_uses_route_template_as_label(client):
+    client.get("/products/999999")
+
+    assert sample("http_requests_total", method="GET", route="/products/{id_product}", status="404") >= 1
+    assert sample("http_requests_total", method="GET", route="/products/999999", status="404") == 0
+
+
+def test_metrics_endpoint_exposes_prometheus_format(client):
+    client.get("/products/")
+    response = client.get("/metrics")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'http_request_duration_seconds_bucket{le="0.005",method="GET",route="/products/"}' in response.text
+    assert "db_pool_checked_out" in response.text
+
+
+def test_server_timing_header_only_in_debug(client, monkeypatch):
+    from src.common.config import settings
+    from src.products.cache import product_cache
+
+    assert "server-timing" not in client.get("/products/").headers
+
+    monkeypatch.setattr(settings, "DEBUG", True)
+    product_cache.invalidate()
+    response = client.get("/products/")
+
+    assert response.headers["server-timing"].startswith("db;dur=")
+    assert 'desc="1 queries"' in response.headers["server-timing"]
+
+
+def test_repeated_statement_shape_logs_n_plus_one_warning(monkeypatch, caplog):
+    from src.common.config import settings
+    from src.common.metrics import QueryStats, statement_shape
+
+    monkeypatch.setattr(settings, "N_PLUS_ONE_THRESHOLD", 3)
+    stats = QueryStats("/orders/1")
+
+    with caplog.at_level("WARNING", logger="src.common.metrics"):
+        for _ in range(5):
+            stats.record("SELECT * FROM product\nWHERE id_product = ?", 0.001)
+        stats.record("SELECT * FROM client WHERE id_client IN (?, ?, ?)", 0.001)
+
+    assert stats.count == 6
+    assert len(caplog.records) == 1
+    assert "/orders/1" in caplog.records[0].getMessage()
+    assert statement_shape("SELECT 1 FROM t WHERE id IN (?, ?, ?)") == statement_shape("SELECT 1 FROM t WHERE id IN (?)")
@@ -1,5 +1,6 @@
 import pytest
 from http import HTTPStatus
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from uuid import uuid4
 
@@ -120,6 +121,152 @@ def test_list_orders_with_date_range(client):
     assert response.status_code == HTTPStatus.OK
 
 
+def test_list_orders_query_count_does_not_grow_with_rows(client, db_session, count_queries):
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    new_client = create_mock_client(db_session)
+    new_client.cpf = "123.456.789-09"
+    db_session.query(Order).delete()
+    db_session.add_all([
+        Order(
+            id_client=new_client.id_client,
+            total_amount=1,
+            total_price=100.0,
+            status="pendente",
+            created_at=datetime.now(),
+            items=[OrderItem(id_product=product.id_product, amount=1, unit_price=100.0)]
+        )
+        for _ in range(5)
+    ])
+    db_session.commit()
+
+    response = client.get("/orders/?include=items,client,products")
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert len(data) == 5
+    assert all(order["client"]["id_client"] == new_client.id_client for order in data)
+    assert all(item["product"]["id_product"] == product.id_product for order in data for item in order["items"])
+    assert len(count_queries) <= 2
+
+
+def test_list_orders_without_items(client, db_session, count_queries):
+    product = create_mock_product(db_session)
+    new_client = create_mock_client(db_session)
+    create_mock_order(db_session, new_client.id_client, product.id_product)
+
+    response = client.get("/orders/?include=")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()[0]["items"] is None
+    assert len(count_queries) == 1
+
+
+def test_list_orders_invalid_include(client):
+    response = client.get("/orders/?include=invoices")
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_list_orders_filters_use_indexes(client, db_session, count_queries, explain_plan):
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    new_client = create_mock_client(db_session)
+    db_session.query(Order).delete()
+    db_session.add_all([
+        Order(
+            id_client=new_client.id_client,
+            total_amount=1,
+            total_price=100.0,
+            status="pago" if index % 2 else "pendente",
+            created_at=datetime.now() - timedelta(days=index),
+            items=[OrderItem(id_product=product.id_product, amount=1, unit_price=100.0)]
+        )
+        for index in range(50)
+    ])
+    db_session.commit()
+
+    expected_indexes = {
+        f"id_client={new_client.id_client}": "ix_order_id_client_id_order",
+        "status=pago": "ix_order_status_id_order",
+        f"id_product={product.id_product}": "ix_orderitem_id_product",
+    }
+
+    for filter_query, index_name in expected_indexes.items():
+        count_queries.clear()
+        response = client.get(f"/orders/?{filter_query}")
+        assert response.status_code == HTTPStatus.OK
+
+        statement, parameters = count_queries[0]
+        assert index_name in explain_plan(statement, parameters)
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_export_orders_csv(client, db_session):
+    import csv
+    import io
+    from src.orders.models import OrderItem
+    db_session.query(OrderItem).delete()
+    product = create_mock_product(db_session)
+    new_client = create_mock_client(db_session)
+    order = create_mock_order(db_session, new_client.id_client, product.id_product)
+
+    response = client.get(f"/orders/export?format=csv&id_product={product.id_product}")
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["content-type"].startswith("text/csv")
+
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 1
+    assert rows[0]["id_order"] == str(order.id_order)
+    assert rows[0]["id_product"] == str(product.id_product)
+    assert rows[0]["amount"] == "2"
+
+
+def test_export_orders_uses_request_connection(client, db_session):
+    from sqlalchemy import event
+    from src.common.database import get_db
+    from src.main import app
+    from tests.conftest import TestingAsyncSessionLocal, async_engine
+    connections = []
+
+    async def connected_get_db():
+        async with TestingAsyncSessionLocal() as db:
+            await db.connection()
+            yield db
+
+    def on_connect(dbapi_connection, connection_record):
+        connections.append(dbapi_connection)
+
+    app.dependency_overrides[get_db] = connected_get_db
+    event.listen(async_engine.sync_engine, "connect", on_connect)
+    try:
+        response = client.get("/orders/export?format=ndjson")
+    finally:
+        event.remove(async_engine.sync_engine, "connect", on_connect)
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(connections) == 1
+
+
+def test_export_orders_ndjson_filters(client, db_session):
+    import json
+    from src.orders.models import OrderItem
+    db_session.query(OrderItem).delete()
+    product = create_mock_product(db_session)
+    new_client = create_mock_client(db_session)
+    create_mock_order(db_session, new_client.id_client, product.id_product)
+
+    response = client.get("/orders/export?format=ndjson&status=pendente")
+    assert response.status_code == HTTPStatus.OK
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 1
+    assert lines[0]["status"] == "pendente"
+
+    response = client.get("/orders/export?format=ndjson&status=cancelado")
+    assert response.status_code == HTTPStatus.OK
+    assert response.text == ""
+
+
 def test_get_order_by_id_success(client, db_session):
     product = create_mock_product(db_session)
     new_client = create_mock_client(db_session)
@@ -183,3 +330,472 @@ def test_delete_order_not_found(client_with_admin):
     data = response.json()
     assert "detail" in data
     assert "Pedido ID 9999 não encontrado" in data["detail"]
+
+
+def test_create_order_insufficient_stock(client_with_admin, db_session):
+    product = create_mock_product(db_session)
+    client = create_mock_client(db_session)
+
+    payload = {
+        "id_client": client.id_client,
+        "status": "pendente",
+        "products": [
+            {"id_product": product.id_product, "amount": 6},
+            {"id_product": product.id_product, "amount": 5}
+        ]
+    }
+
+    response = client_with_admin.post("/orders/", json=payload)
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    db_session.refresh(product)
+    assert product.stock == 10
+
+
+def test_concurrent_orders_never_oversell(client_with_admin, db_session):
+    product = create_mock_product(db_session)
+    client = create_mock_client(db_session)
+    initial_stock = product.stock
+
+    payload = {
+        "id_client": client.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 1}]
+    }
+
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        responses = list(executor.map(
+            lambda _: client_with_admin.post("/orders/", json=payload), range(200)
+        ))
+
+    # SQLite ignora FOR UPDATE e serializa as escritas no arquivo; o bloqueio de
+    # linha em si não é exercitado aqui, só o resultado final do decremento.
+    created = sum(1 for response in responses if response.status_code == HTTPStatus.CREATED)
+    rejected = [response for response in responses if response.status_code != HTTPStatus.CREATED]
+
+    db_session.refresh(product)
+    assert created == initial_stock
+    assert all(response.status_code == HTTPStatus.BAD_REQUEST for response in rejected)
+    assert product.stock == 0
+
+    from src.orders.models import Order, OrderItem
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_create_order_query_count_is_bounded(client_with_admin, db_session, max_queries):
+    from src.products.models import Product
+    client_obj = create_mock_client(db_session)
+    first = create_mock_product(db_session)
+    products = [first] + [
+        Product(
+            name=f"Produto {index}", bar_code=f"BOUNDED-{uuid4().hex[:12]}", description="Teste",
+            price=10.0, stock=10, valid_date=first.valid_date, category="geral", section="geral",
+        )
+        for index in range(4)
+    ]
+    db_session.add_all(products)
+    db_session.commit()
+
+    payload = {
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 1} for product in products]
+    }
+
+    # SQLite emite um INSERT por item com RETURNING; o restante não cresce com o pedido
+    with max_queries(6 + len(products)):
+        response = client_with_admin.post("/orders/", json=payload)
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()["total_amount"] == 5
+
+    from src.orders.models import Order, OrderItem
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_update_order_only_touches_changed_lines(client_with_admin, db_session, max_queries):
+    from src.orders.models import Order, OrderItem
+    from src.products.models import Product
+    client_obj = create_mock_client(db_session)
+    first = create_mock_product(db_session)
+    products = [first] + [
+        Product(
+            name=f"Produto {index}", bar_code=f"DIFF-{uuid4().hex[:12]}", description="Teste",
+            price=10.0, stock=10, valid_date=first.valid_date, category="geral", section="geral",
+        )
+        for index in range(49)
+    ]
+    db_session.add_all(products)
+    db_session.commit()
+
+    lines = [{"id_product": product.id_product, "amount": 2} for product in products]
+    response = client_with_admin.post("/orders/", json={
+        "id_client": client_obj.id_client, "status": "pendente", "products": lines
+    })
+    assert response.status_code == HTTPStatus.CREATED
+    created = response.json()
+
+    lines[0]["amount"] = 5
+    with max_queries(6) as statements:
+        response = client_with_admin.put(f"/orders/{created['id_order']}", json={"products": lines})
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["total_amount"] == 2 * 49 + 5
+    assert [item["id_orderitem"] for item in data["items"]] == [item["id_orderitem"] for item in created["items"]]
+    assert not any(statement.startswith(("INSERT", "DELETE")) for statement, _ in statements)
+
+    db_session.expire_all()
+    assert db_session.get(Product, products[0].id_product).stock == 5
+    assert db_session.get(Product, products[1].id_product).stock == 8
+
+    response = client_with_admin.put(f"/orders/{created['id_order']}", json={"products": [
+        {"id_product": products[1].id_product, "amount": 1},
+        {"id_product": products[1].id_product, "amount": 3},
+    ]})
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["total_amount"] == 4
+    assert len(data["items"]) == 1
+
+    db_session.expire_all()
+    assert db_session.get(Product, products[0].id_product).stock == 10
+    assert db_session.get(Product, products[1].id_product).stock == 6
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_delete_order_restocks_in_bulk(client_with_admin, db_session, max_queries):
+    from src.products.models import Product
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    order = create_mock_order(db_session, client_obj.id_client, product.id_product)
+
+    with max_queries(6) as statements:
+        response = client_with_admin.delete(f"/orders/{order.id_order}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["items"]) == 1
+    assert sum(statement.startswith("DELETE") for statement, _ in statements) == 2
+
+    db_session.expire_all()
+    assert db_session.get(Product, product.id_product).stock == 12
+
+
+def test_delete_orders_batch(client_with_admin, db_session):
+    from src.orders.models import Order, OrderItem
+    from src.products.models import Product
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    orders = [
+        Order(
+            id_client=client_obj.id_client, total_amount=2, total_price=200.0, status="pendente",
+            created_at=datetime.now(), items=[OrderItem(id_product=product.id_product, amount=2, unit_price=100.0)]
+        )
+        for _ in range(3)
+    ]
+    db_session.add_all(orders)
+    db_session.commit()
+    ids = ",".join(str(order.id_order) for order in orders)
+
+    response = client_with_admin.delete(f"/orders/?ids={ids},99999")
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert "99999" in response.json()["detail"]
+
+    response = client_with_admin.delete(f"/orders/?ids={ids}")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["deleted"] == sorted(order.id_order for order in orders)
+
+    db_session.expire_all()
+    assert db_session.query(Order).count() == 0
+    assert db_session.query(OrderItem).count() == 0
+    assert db_session.get(Product, product.id_product).stock == 10 + 3 * 2
+
+
+def test_delete_orders_batch_invalid_ids(client_with_admin):
+    response = client_with_admin.delete("/orders/?ids=1,abc")
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_delete_client_and_product_with_orders_are_rejected(client_with_admin, db_session, max_queries):
+    from sqlalchemy.exc import InvalidRequestError
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    create_mock_order(db_session, client_obj.id_client, product.id_product)
+
+    with max_queries(2):
+        response = client_with_admin.delete(f"/clients/{client_obj.id_client}")
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    with max_queries(2):
+        response = client_with_admin.delete(f"/products/{product.id_product}")
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    with pytest.raises(InvalidRequestError):
+        client_obj.orders
+    with pytest.raises(InvalidRequestError):
+        product.order_items
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_create_order_idempotency_key_replays_response(client_with_admin, db_session):
+    from src.orders.models import Order, OrderItem, IdempotencyKey
+    from src.products.models import Product
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    payload = {
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 3}]
+    }
+    headers = {"Idempotency-Key": f"retry-{uuid4()}"}
+
+    first = client_with_admin.post("/orders/", json=payload, headers=headers)
+    second = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    assert first.status_code == second.status_code == HTTPStatus.CREATED
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert second.json() == first.json()
+
+    db_session.expire_all()
+    assert db_session.query(Order).count() == 1
+    assert db_session.get(Product, product.id_product).stock == 10 - 3
+
+    payload["products"][0]["amount"] = 1
+    response = client_with_admin.post("/orders/", json=payload, headers=headers)
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    db_session.query(IdempotencyKey).delete()
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_create_order_idempotency_key_conflict_replays_winner(client_with_admin, db_session, monkeypatch):
+    from src.orders import idempotency
+    from src.orders.models import Order, OrderItem, IdempotencyKey
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    payload = {
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 1}]
+    }
+    headers = {"Idempotency-Key": f"race-{uuid4()}"}
+    first = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    find_stored_response = idempotency.find_stored_response
+    calls = []
+
+    async def miss_first_lookup(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            return None
+        return await find_stored_response(*args)
+
+    monkeypatch.setattr(idempotency, "find_stored_response", miss_first_lookup)
+    second = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    assert len(calls) == 2
+    assert second.status_code == HTTPStatus.CREATED
+    assert second.json()["id_order"] == first.json()["id_order"]
+
+    db_session.query(IdempotencyKey).delete()
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_create_order_expired_idempotency_key_runs_again(client_with_admin, db_session, monkeypatch):
+    from src.common.config import settings
+    from src.orders import idempotency
+    from src.orders.models import Order, OrderItem, IdempotencyKey
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    payload = {
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 1}]
+    }
+    headers = {"Idempotency-Key": f"expired-{uuid4()}"}
+    first = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    monkeypatch.setattr(settings, "IDEMPOTENCY_KEY_TTL", -1)
+    second = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    assert "Idempotent-Replayed" not in second.headers
+    assert second.json()["id_order"] != first.json()["id_order"]
+
+    async def skip_purge(db):
+        return None
+
+    monkeypatch.setattr(idempotency, "purge_expired_keys", skip_purge)
+    payload["products"][0]["amount"] = 2
+    third = client_with_admin.post("/orders/", json=payload, headers=headers)
+
+    assert third.status_code == HTTPStatus.CREATED
+    assert "Idempotent-Replayed" not in third.headers
+    assert third.json()["id_order"] != second.json()["id_order"]
+
+    db_session.query(IdempotencyKey).delete()
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_create_orders_batch_reports_per_order(client_with_admin, db_session, max_queries):
+    from src.orders.models import Order, OrderItem
+    from src.products.models import Product
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+    def order(amount, id_client=client_obj.id_client, id_product=product.id_product):
+        return {
+            "id_client": id_client,
+            "status": "pendente",
+            "products": [{"id_product": id_product, "amount": amount}]
+        }
+
+    payload = {"orders": [
+        order(4), order(1, id_client=99999), order(5), order(2), order(1, id_product=99999)
+    ]}
+    with max_queries(6):
+        response = client_with_admin.post("/orders/batch", json=payload)
+
+    assert response.status_code == HTTPStatus.CREATED
+    report = response.json()
+    assert (report["created"], report["failed"]) == (2, 3)
+    results = report["results"]
+    assert results[0]["id_order"] and results[2]["id_order"]
+    assert "Cliente ID 99999" in results[1]["detail"]
+    assert "Estoque insuficiente" in results[3]["detail"]
+    assert "Produto ID 99999" in results[4]["detail"]
+
+    db_session.expire_all()
+    assert db_session.get(Product, product.id_product).stock == 1
+    created = db_session.get(Order, results[2]["id_order"])
+    assert (created.total_amount, created.total_price) == (5, product.price * 5)
+    assert db_session.query(OrderItem).count() == 2
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_order_conditional_get_tracks_item_changes(client_with_admin, db_session):
+    from src.products.models import Product
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    order = create_mock_order(db_session, client_obj.id_client, product.id_product)
+    other = Product(
+        name="Outro", bar_code=f"ETAG-{uuid4().hex[:12]}", description="Teste", price=100.0,
+        stock=10, valid_date=product.valid_date, category="geral", section="geral",
+    )
+    db_session.add(other)
+    db_session.commit()
+
+    response = client_with_admin.get(f"/orders/{order.id_order}")
+    etag = response.headers["ETag"]
+    response = client_with_admin.get(f"/orders/{order.id_order}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    assert "ETag" not in client_with_admin.get(f"/orders/{order.id_order}?include=items,client").headers
+
+    client_with_admin.put(f"/orders/{order.id_order}", json={
+        "products": [{"id_product": other.id_product, "amount": 2}]
+    })
+    response = client_with_admin.get(f"/orders/{order.id_order}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] != etag
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_fast_json_order_listing_matches_schema(client_with_admin, db_session, monkeypatch, max_queries):
+    from src.common.config import settings
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    create_mock_order(db_session, client_obj.id_client, product.id_product)
+
+    urls = ("/orders/", "/orders/?include=", "/orders/?include=items,client")
+    expected = [client_with_admin.get(url) for url in urls]
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    with max_queries(2):
+        response = client_with_admin.get(urls[0])
+    responses = [response] + [client_with_admin.get(url) for url in urls[1:]]
+
+    assert [response.json() for response in responses] == [response.json() for response in expected]
+    assert responses[0].json()[0]["items"]
+    assert responses[0].headers["ETag"] == expected[0].headers["ETag"]
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
+
+
+def test_order_listing_sparse_fields_and_summary(client_with_admin, db_session, max_queries):
+    from src.orders.models import Order, OrderItem
+    product = create_mock_product(db_session)
+    client_obj = create_mock_client(db_session)
+    order = create_mock_order(db_session, client_obj.id_client, product.id_product)
+
+    with max_queries(1) as statements:
+        response = client_with_admin.get("/orders/?view=summary")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == [{
+        "id_order": order.id_order,
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "total_amount": 2,
+        "total_price": 200.0,
+        "created_at": response.json()[0]["created_at"],
+    }]
+    assert "orderitem" not in statements[0][0]
+
+    with max_queries(1) as statements:
+        response = client_with_admin.get("/orders/?fields=status,total_price&include=items,client")
+    assert response.json() == [{"status": "pendente", "total_price": 200.0}]
+    assert "total_amount" not in statements[0][0] and "JOIN" not in statements[0][0]
+
+    response = client_with_admin.get("/orders/?fields=id_order,items&include=")
+    assert list(response.json()[0]) == ["id_order", "items"]
+    assert response.json()[0]["items"][0]["amount"] == 2
+
+    schema = client_with_admin.get("/openapi.json").json()
+    listing = schema["paths"]["/orders/"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert {variant["items"]["$ref"] for variant in listing["anyOf"]} == {
+        "#/components/schemas/OrderResponse", "#/components/schemas/OrderSummaryResponse"
+    }
+
+    etag = response.headers["ETag"]
+    response = client_with_admin.get("/orders/?fields=id_order,items", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    response = client_with_admin.get("/orders/?fields=id_order", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.OK
+
+    assert client_with_admin.get("/orders/?fields=senha").status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert client_with_admin.get("/orders/?view=summary&fields=status").status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert client_with_admin.get("/orders/?view=compacto").status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.commit()
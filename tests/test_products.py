@@ -60,6 +60,108 @@ def test_create_product_success(client_with_admin):
     assert response.json()["bar_code"] == barcode
 
 
+def test_bulk_import_csv_upserts_and_reports_errors(client_with_admin, db_session):
+    db_session.query(Product).delete()
+    db_session.commit()
+    db_session.add(Product(name="Antigo", bar_code="BULK-1", price=10.0, stock=1))
+    db_session.commit()
+
+    content = (
+        "name,bar_code,price,stock,category,valid_date\n"
+        "Camiseta,BULK-1,59.90,12,Vestuário,2025-12-31\n"
+        "Bermuda,BULK-2,79.90,5,,\n"
+        "Sem preço,BULK-3,,5,,\n"
+    )
+    files = {"file": ("produtos.csv", io.BytesIO(content.encode()), "text/csv")}
+    response = client_with_admin.post("/products/bulk", files=files)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["imported"] == 2
+    assert data["failed"] == 1
+    assert data["errors"][0]["row"] == 4
+
+    db_session.expire_all()
+    updated = db_session.query(Product).filter(Product.bar_code == "BULK-1").one()
+    assert updated.name == "Camiseta"
+    assert updated.stock == 12
+    assert db_session.query(Product).count() == 2
+
+
+def test_bulk_import_ndjson(client_with_admin, db_session):
+    db_session.query(Product).delete()
+    db_session.commit()
+
+    content = (
+        '{"name": "Boné", "bar_code": "ND-1", "price": 39.9, "stock": 3}\n'
+        '\n'
+        'not json\n'
+    )
+    files = {"file": ("produtos.ndjson", io.BytesIO(content.encode()), "application/x-ndjson")}
+    response = client_with_admin.post("/products/bulk", files=files)
+
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert data["imported"] == 1
+    assert data["failed"] == 1
+    assert data["errors"][0]["row"] == 3
+
+
+def test_bulk_import_reports_duplicate_bar_codes(client_with_admin, db_session):
+    db_session.query(Product).delete()
+    db_session.commit()
+
+    content = (
+        "name,bar_code,price,stock\n"
+        "Primeira,DUP-1,10.0,1\n"
+        "Outro,DUP-2,10.0,1\n"
+        "Segunda,DUP-1,20.0,2\n"
+    )
+    files = {"file": ("produtos.csv", io.BytesIO(content.encode()), "text/csv")}
+    data = client_with_admin.post("/products/bulk", files=files).json()
+
+    assert data["imported"] == 2
+    assert data["failed"] == 1
+    assert data["errors"] == [{"row": 2, "detail": "bar_code repetido, substituído pela linha 4"}]
+
+    db_session.expire_all()
+    assert db_session.query(Product).filter(Product.bar_code == "DUP-1").one().name == "Segunda"
+
+
+def test_bulk_import_keeps_columns_missing_from_file(client_with_admin, db_session):
+    db_session.query(Product).delete()
+    db_session.commit()
+    db_session.add_all([
+        Product(
+            name="Antigo", bar_code="KEEP-1", price=10.0, stock=1, description="Descrição",
+            images="media/antigo.png", category="Vestuário", section="Moda", valid_date=date(2030, 1, 1),
+        ),
+        Product(name="Outro", bar_code="KEEP-2", price=10.0, stock=1, description="Manter"),
+    ])
+    db_session.commit()
+
+    csv_content = "name,bar_code,price,stock\nNovo,KEEP-1,20.0,5\n"
+    files = {"file": ("produtos.csv", io.BytesIO(csv_content.encode()), "text/csv")}
+    assert client_with_admin.post("/products/bulk", files=files).json()["imported"] == 1
+
+    ndjson_content = (
+        '{"name": "Outro novo", "bar_code": "KEEP-2", "price": 15.0, "stock": 2}\n'
+        '{"name": "Novo 3", "bar_code": "KEEP-3", "price": 15.0, "stock": 2, "section": "Moda"}\n'
+    )
+    files = {"file": ("produtos.ndjson", io.BytesIO(ndjson_content.encode()), "application/x-ndjson")}
+    assert client_with_admin.post("/products/bulk", files=files).json()["imported"] == 2
+
+    db_session.expire_all()
+    kept = db_session.query(Product).filter(Product.bar_code == "KEEP-1").one()
+    assert (kept.name, kept.price, kept.stock) == ("Novo", 20.0, 5)
+    assert (kept.description, kept.images, kept.category, kept.section) == (
+        "Descrição", "media/antigo.png", "Vestuário", "Moda"
+    )
+    assert kept.valid_date.date() == date(2030, 1, 1)
+    assert db_session.query(Product).filter(Product.bar_code == "KEEP-2").one().description == "Manter"
+    assert db_session.query(Product).filter(Product.bar_code == "KEEP-3").one().section == "Moda"
+
+
 def test_create_product_invalid_date(client_with_admin):
     data = {
         "name": "Produto X",
@@ -88,6 +190,49 @@ def test_pagination(client):
     assert len(response.json()) == 1
 
 
+def test_cursor_pagination(client, db_session):
+    create_mock_products(db_session)
+
+    first_page = client.get("/products/?limit=2")
+    assert first_page.status_code == HTTPStatus.OK
+    assert len(first_page.json()) == 2
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = client.get(f"/products/?limit=2&cursor={cursor}")
+    assert second_page.status_code == HTTPStatus.OK
+    assert len(second_page.json()) == 1
+    assert "X-Next-Cursor" not in second_page.headers
+
+    first_ids = {prod["id_product"] for prod in first_page.json()}
+    assert second_page.json()[0]["id_product"] not in first_ids
+
+
+def test_cursor_pagination_invalid_cursor(client):
+    response = client.get("/products/?cursor=not-a-cursor")
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+
+def test_search_products_ranks_name_matches_first(client, db_session):
+    create_mock_products(db_session)
+
+    response = client.get("/products/search?q=tên")
+    assert response.status_code == HTTPStatus.OK
+    data = response.json()
+    assert [prod["name"] for prod in data] == ["Tênis Esportivo"]
+
+    response = client.get("/products/search?q=eletr")
+    assert response.status_code == HTTPStatus.OK
+    assert {prod["name"] for prod in response.json()} == {"Notebook", "Fone Bluetooth"}
+
+
+def test_search_products_escapes_wildcards(client, db_session):
+    create_mock_products(db_session)
+
+    response = client.get("/products/search?q=%25%25")
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == []
+
+
 def test_filter_by_category(client, db_session):
     create_mock_products(db_session)
 
@@ -98,6 +243,16 @@ def test_filter_by_category(client, db_session):
     assert len(data) == 2
 
 
+def test_filter_by_price_uses_index(client, db_session, count_queries, explain_plan):
+    create_mock_products(db_session)
+
+    response = client.get("/products/?price=199.90")
+    assert response.status_code == HTTPStatus.OK
+
+    statement, parameters = count_queries[0]
+    assert "ix_product_price" in explain_plan(statement, parameters)
+
+
 def test_filter_by_price(client, db_session):
     create_mock_products(db_session)
 
@@ -179,3 +334,188 @@ def test_delete_product_not_found(client_with_admin):
     response = client_with_admin.delete("/products/9999")
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert "não encontrado" in response.json()["detail"].lower()
+
+
+def test_product_detail_and_list_are_cached_until_update(client_with_admin, db_session, max_queries):
+    create_mock_products(db_session)
+    product = db_session.query(Product).first()
+
+    first = client_with_admin.get(f"/products/{product.id_product}")
+    listing = client_with_admin.get("/products/?category=Eletr")
+    with max_queries(0):
+        assert client_with_admin.get(f"/products/{product.id_product}").json() == first.json()
+        assert client_with_admin.get("/products/?category=Eletr").json() == listing.json()
+
+    response = client_with_admin.put(f"/products/{product.id_product}", data={"price": 149})
+    assert response.status_code == HTTPStatus.OK
+
+    assert client_with_admin.get(f"/products/{product.id_product}").json()["price"] == 149
+    listed = {item["id_product"]: item for item in client_with_admin.get("/products/?category=Eletr").json()}
+    assert listed[product.id_product]["price"] == 149
+
+
+def test_product_cache_invalidated_by_stock_changes(client_with_admin, db_session):
+    from src.clients.models import Client
+    from src.orders.models import Order, OrderItem
+    create_mock_products(db_session)
+    product = db_session.query(Product).filter(Product.stock == 10).one()
+    client_obj = Client(name="Cliente Cache", cpf="52998224725", email=f"{uuid.uuid4().hex[:8]}@email.com")
+    db_session.add(client_obj)
+    db_session.commit()
+
+    assert client_with_admin.get(f"/products/{product.id_product}").json()["stock"] == 10
+
+    response = client_with_admin.post("/orders/", json={
+        "id_client": client_obj.id_client,
+        "status": "pendente",
+        "products": [{"id_product": product.id_product, "amount": 4}]
+    })
+    assert response.status_code == HTTPStatus.CREATED
+    assert client_with_admin.get(f"/products/{product.id_product}").json()["stock"] == 6
+
+    response = client_with_admin.delete(f"/orders/{response.json()['id_order']}")
+    assert response.status_code == HTTPStatus.OK
+    assert client_with_admin.get(f"/products/{product.id_product}").json()["stock"] == 10
+
+    db_session.query(OrderItem).delete()
+    db_session.query(Order).delete()
+    db_session.delete(client_obj)
+    db_session.commit()
+
+
+def test_product_cache_notifications():
+    from src.products.cache import (
+        ProductCache, decode_payload, encode_payload, on_notification, product_cache
+    )
+
+    assert decode_payload(encode_payload({3, 1})) == {1, 3}
+    assert encode_payload({index for index in range(5000)}) == "*"
+    assert decode_payload("*") is None
+
+    product_cache.set_detail(1, "cached", product_cache.generation)
+    on_notification(None, 1234, "product_cache", "1")
+    assert product_cache.get_detail(1) is None
+
+    cache = ProductCache(maxsize=10, ttl=60)
+    generation = cache.generation
+    cache.invalidate([1])
+    cache.set_detail(1, "stale", generation)
+    assert cache.get_detail(1) is None
+
+
+def test_invalidation_listener_clears_cache_and_reconnects(monkeypatch):
+    import asyncio
+    from src.products import cache
+
+    class FakeConnection:
+        def __init__(self):
+            self.termination_listeners = []
+
+        async def add_listener(self, channel, callback):
+            pass
+
+        def add_termination_listener(self, callback):
+            self.termination_listeners.append(callback)
+
+        async def close(self):
+            pass
+
+    attempts = []
+
+    async def connect(dsn):
+        attempts.append(dsn)
+        if len(attempts) == 2:
+            raise OSError("banco indisponível")
+        return FakeConnection()
+
+    monkeypatch.setattr(cache.asyncpg, "connect", connect)
+    monkeypatch.setattr(cache, "RECONNECT_MIN_DELAY", 0)
+
+    async def scenario():
+        listener = cache.InvalidationListener("postgresql://banco")
+        await listener.connect()
+        dropped = listener.connection
+
+        cache.product_cache.set_detail(1, "cached", cache.product_cache.generation)
+        dropped.termination_listeners[0](dropped)
+        assert cache.product_cache.get_detail(1) is None
+
+        await listener.reconnecting
+        reconnected = listener.connection
+        await listener.close()
+        return dropped, reconnected
+
+    dropped, reconnected = asyncio.run(scenario())
+    assert len(attempts) == 3
+    assert reconnected is not None and reconnected is not dropped
+
+
+def test_product_conditional_get(client_with_admin, db_session, max_queries):
+    from src.products.cache import product_cache
+    create_mock_products(db_session)
+    product = db_session.query(Product).first()
+
+    response = client_with_admin.get(f"/products/{product.id_product}")
+    etag = response.headers["ETag"]
+    assert etag == f'"product-{product.id_product}-1"'
+    assert "Last-Modified" in response.headers
+
+    product_cache.invalidate()
+    with max_queries(1):
+        response = client_with_admin.get(f"/products/{product.id_product}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    listing = client_with_admin.get("/products/?category=Eletr")
+    list_etag = listing.headers["ETag"]
+    assert list_etag.startswith('W/"')
+    product_cache.invalidate()
+    response = client_with_admin.get("/products/?category=Eletr", headers={"If-None-Match": list_etag})
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    client_with_admin.put(f"/products/{product.id_product}", data={"price": 149})
+
+    response = client_with_admin.get(f"/products/{product.id_product}", headers={"If-None-Match": etag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] == f'"product-{product.id_product}-2"'
+
+    response = client_with_admin.get("/products/?category=Eletr", headers={"If-None-Match": list_etag})
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] != list_etag
+
+
+def test_product_list_etag_changes_when_page_rows_change(client_with_admin, db_session):
+    from src.products.cache import product_cache
+    create_mock_products(db_session)
+    first, second, third = db_session.query(Product).order_by(Product.id_product).all()
+    first.stock = 7
+    db_session.commit()
+
+    listing = client_with_admin.get("/products/?limit=2")
+    assert [item["id_product"] for item in listing.json()] == [first.id_product, second.id_product]
+
+    db_session.delete(second)
+    db_session.commit()
+    product_cache.invalidate()
+
+    response = client_with_admin.get("/products/?limit=2", headers={"If-None-Match": listing.headers["ETag"]})
+    assert response.status_code == HTTPStatus.OK
+    assert [item["id_product"] for item in response.json()] == [first.id_product, third.id_product]
+    assert response.headers["ETag"] != listing.headers["ETag"]
+
+
+def test_fast_json_product_listing_matches_schema(client, db_session, monkeypatch):
+    from src.common.config import settings
+    from src.products.cache import product_cache
+    create_mock_products(db_session)
+    product_cache.invalidate()
+
+    expected = [client.get(url) for url in ("/products/?limit=2", "/products/search?q=no")]
+    product_cache.invalidate()
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", True)
+    responses = [client.get(url) for url in ("/products/?limit=2", "/products/search?q=no")]
+
+    assert [response.json() for response in responses] == [response.json() for response in expected]
+    assert responses[0].headers["ETag"] == expected[0].headers["ETag"]
+    assert responses[0].headers["X-Next-Cursor"] == expected[0].headers["X-Next-Cursor"]
@@ -0,0 +1,100 @@
+import asyncio
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from src.main import app
+from src.utils.singleflight import SingleFlight
+
+
+def sample(name, route):
+    return REGISTRY.get_sample_value(name, {"route": route}) or 0
+
+
+def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight(timeout=1)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return b"[]"
+
+    async def scenario():
+        return await asyncio.gather(*(flights.run("key", compute, route="/test-shared") for _ in range(20)))
+
+    coalesced = sample("http_coalesced_requests_total", "/test-shared")
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert sample("http_coalesced_requests_total", "/test-shared") == coalesced + 19
+
+
+def test_follower_computes_itself_after_bounded_wait():
+    flights = SingleFlight(timeout=0.01)
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.1 if len(calls) == 1 else 0)
+        return len(calls)
+
+    async def scenario():
+        return await asyncio.gather(
+            flights.run("key", compute, route="/test-timeout"),
+            flights.run("key", compute, route="/test-timeout"),
+        )
+
+    assert asyncio.run(scenario()) == [2, 2]
+    assert len(calls) == 2
+    assert sample("http_coalesce_timeouts_total", "/test-timeout") == 1
+
+
+def test_leader_errors_reach_followers_and_cancellation_does_not():
+    flights = SingleFlight(timeout=1)
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("falhou")
+
+    async def failing():
+        return await asyncio.gather(
+            flights.run("key", fail, route="/test-error"),
+            flights.run("key", fail, route="/test-error"),
+            return_exceptions=True,
+        )
+
+    assert all(isinstance(result, ValueError) for result in asyncio.run(failing()))
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    async def cancelled_leader():
+        leader = asyncio.create_task(flights.run("other", slow, route="/test-cancel"))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flights.run("other", slow, route="/test-cancel"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(cancelled_leader()) == "ok"
+
+
+def test_identical_product_listings_are_coalesced(client, db_session, count_queries):
+    from src.products.cache import product_cache
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+            return await asyncio.gather(*(http.get("/products/?category=flash") for _ in range(20)))
+
+    product_cache.invalidate()
+    count_queries.clear()
+    responses = asyncio.run(scenario())
+
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.content for response in responses}) == 1
+    assert len(count_queries) < 20